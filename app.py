@@ -12,49 +12,140 @@ st.set_page_config(
 )
 
 import os
+import re
+import hashlib
 from datetime import datetime
-from utils.resume_analyzer import ResumeAnalyzer
-from utils.ai_resume_analyzer import AIResumeAnalyzer
-from utils.resume_builder import ResumeBuilder
-import pandas as pd
-
-# Load environment variables from Streamlit secrets
-try:
-    # Get API keys from Streamlit secrets
-    google_api_key = st.secrets["api_keys"]["GOOGLE_API_KEY"]
-    openrouter_api_key = st.secrets["api_keys"]["OPENROUTER_API_KEY"]
-    database_url = st.secrets["database"]["DATABASE_URL"]
-    
-    # Set environment variables
-    os.environ["GOOGLE_API_KEY"] = google_api_key
-    os.environ["OPENROUTER_API_KEY"] = openrouter_api_key
-    os.environ["DATABASE_URL"] = database_url
-    
-except Exception as e:
-    st.error(f"Error loading secrets: {str(e)}")
-    st.info("Please make sure you have set up your secrets.toml file with the required API keys.")
-    # Set default values if secrets loading fails
-    os.environ["GOOGLE_API_KEY"] = "your_google_api_key_here"
-    os.environ["OPENROUTER_API_KEY"] = "your_openrouter_api_key_here"
-    os.environ["DATABASE_URL"] = "sqlite:///resume_data.db"
+
+# st.fragment shipped after the pinned 1.32 (experimental in 1.33); fall
+# back to a plain method call when unavailable
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda f: f)
+
+# Sidebar navigation entries (page name -> icon)
+PAGES = {
+    'Home': '🏠',
+    'Resume Analyzer': '📊',
+    'Resume Builder': '📝',
+    'Dashboard': '📈',
+    'About': 'ℹ️'
+}
+
+# Splits comma-separated skill lists, folding the surrounding whitespace
+# into the delimiter so no per-item strip() is needed
+_SKILL_SPLIT = re.compile(r'\s*,\s*')
+
+def _fmt_month_year(d):
+    """Format a date as e.g. 'April 2025' for resume entries"""
+    return d.strftime("%B %Y")
+
+@st.cache_resource
+def _bootstrap_env():
+    """Load environment variables from Streamlit secrets, once per process"""
+    try:
+        # Get API keys from Streamlit secrets
+        os.environ["GOOGLE_API_KEY"] = st.secrets["api_keys"]["GOOGLE_API_KEY"]
+        os.environ["OPENROUTER_API_KEY"] = st.secrets["api_keys"]["OPENROUTER_API_KEY"]
+        os.environ["DATABASE_URL"] = st.secrets["database"]["DATABASE_URL"]
+        return True
+    except Exception as e:
+        st.error(f"Error loading secrets: {str(e)}")
+        st.info("Please make sure you have set up your secrets.toml file with the required API keys.")
+        # Set default values if secrets loading fails
+        os.environ["GOOGLE_API_KEY"] = "your_google_api_key_here"
+        os.environ["OPENROUTER_API_KEY"] = "your_openrouter_api_key_here"
+        os.environ["DATABASE_URL"] = "sqlite:///resume_data.db"
+        return False
+
+_bootstrap_env()
+
+# Heavy modules are imported inside the cached factories below so a cold
+# start on the Home/About pages doesn't pay for pandas, google-genai,
+# reportlab, etc. Each import still happens at most once per process.
+@st.cache_resource
+def get_resume_analyzer():
+    """Create the ResumeAnalyzer once and reuse it across reruns"""
+    from utils.resume_analyzer import ResumeAnalyzer
+    return ResumeAnalyzer()
+
+@st.cache_resource
+def get_ai_analyzer():
+    """Create the AIResumeAnalyzer once, or None if initialization fails"""
+    try:
+        from utils.ai_resume_analyzer import AIResumeAnalyzer
+        from utils.database import init_db
+        # All database access flows through the AI analyzer, so ensure the
+        # schema exists the first time it is constructed
+        init_db()
+        return AIResumeAnalyzer()
+    except Exception as e:
+        st.error(f"Error initializing AI analyzer: {str(e)}")
+        st.info("Please make sure you have set up your secrets.toml file with the required API keys.")
+        return None
+
+@st.cache_resource
+def get_resume_builder():
+    """Create the ResumeBuilder once and reuse it across reruns"""
+    from utils.resume_builder import ResumeBuilder
+    return ResumeBuilder()
+
+@st.cache_data(show_spinner=False)
+def _extract_text(file_bytes: bytes, name: str) -> str:
+    """Extract text from uploaded resume bytes, memoized on the file content"""
+    from io import BytesIO
+    analyzer = get_ai_analyzer()
+    if analyzer is None:
+        return ""
+    file_obj = BytesIO(file_bytes)
+    if name.endswith('.pdf'):
+        return analyzer.extract_text_from_pdf(file_obj)
+    return analyzer.extract_text_from_docx(file_obj)
+
+@st.cache_data(show_spinner=False)
+def _cached_pdf(result_hash: str, candidate: str, role: str, _result: dict) -> bytes:
+    """Generate the PDF report once per (analysis, candidate, role) and reuse the bytes
+
+    The hash keys the cache; the analysis dict itself is passed with a
+    leading underscore so Streamlit doesn't try to hash it.
+    """
+    analyzer = get_ai_analyzer()
+    if analyzer is None:
+        return b""
+    buffer = analyzer.generate_pdf_report(
+        analysis_result=_result,
+        candidate_name=candidate,
+        job_role=role
+    )
+    return buffer.getvalue() if buffer else b""
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _dashboard_payload():
+    """Fetch everything the dashboard needs in one cached call
+
+    The statistics and recent-analyses queries are independent and
+    IO-bound, so they run concurrently; the combined payload is cached
+    briefly so sidebar clicks don't re-hit the database per rerun.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    analyzer = get_ai_analyzer()
+    if analyzer is None:
+        return {'stats': None, 'recent': []}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stats_future = executor.submit(analyzer.get_ai_analysis_statistics)
+        recent_future = executor.submit(analyzer.get_recent_analyses, 5)
+
+    return {'stats': stats_future.result(), 'recent': recent_future.result()}
+
 
 class ResumeApp:
     def __init__(self):
         """Initialize the Resume App"""
-        self.resume_analyzer = ResumeAnalyzer()
-        
-        # Initialize AI analyzer with error handling
-        try:
-            self.ai_analyzer = AIResumeAnalyzer()
-            if not self.ai_analyzer:
-                st.error("Failed to initialize AI analyzer. Please check your API keys.")
-                self.ai_analyzer = None
-        except Exception as e:
-            st.error(f"Error initializing AI analyzer: {str(e)}")
-            st.info("Please make sure you have set up your secrets.toml file with the required API keys.")
-            self.ai_analyzer = None
-        
-        self.resume_builder = ResumeBuilder()
+        self.resume_analyzer = get_resume_analyzer()
+
+        # Cached factory returns None if initialization failed
+        self.ai_analyzer = get_ai_analyzer()
+
+        self.resume_builder = get_resume_builder()
         
         # Initialize session state
         if 'current_page' not in st.session_state:
@@ -70,34 +161,32 @@ class ResumeApp:
 
     def main(self):
         """Main application entry point"""
-        # Sidebar navigation
+        # Sidebar navigation: a single radio updates the page in one rerun
+        # instead of the button-per-page loop's state-update + render pair
         with st.sidebar:
             st.title("Smart Resume AI")
-            
-            # Navigation buttons
-            pages = {
-                'Home': '🏠',
-                'Resume Analyzer': '📊',
-                'Resume Builder': '📝',
-                'Dashboard': '📈',
-                'About': 'ℹ️'
-            }
-            
-            for page, icon in pages.items():
-                if st.button(f"{icon} {page}", use_container_width=True):
-                    st.session_state.current_page = page
-
-        # Main content area
-        if st.session_state.current_page == 'Home':
-            self.show_home()
-        elif st.session_state.current_page == 'Resume Analyzer':
-            self.show_analyzer()
-        elif st.session_state.current_page == 'Resume Builder':
-            self.show_builder()
-        elif st.session_state.current_page == 'Dashboard':
-            self.show_dashboard()
-        elif st.session_state.current_page == 'About':
-            self.show_about()
+
+            page_names = list(PAGES)
+            selection = st.radio(
+                "Navigate",
+                page_names,
+                index=page_names.index(st.session_state.current_page),
+                format_func=lambda page: f"{PAGES[page]} {page}",
+                label_visibility="collapsed"
+            )
+            if selection != st.session_state.current_page:
+                st.session_state.current_page = selection
+
+        # Main content area: table-driven dispatch; page-specific heavy
+        # imports (pandas, docx, ...) happen inside each page method
+        dispatch = {
+            'Home': self.show_home,
+            'Resume Analyzer': self.show_analyzer,
+            'Resume Builder': self.show_builder,
+            'Dashboard': self.show_dashboard,
+            'About': self.show_about
+        }
+        dispatch.get(st.session_state.current_page, self.show_home)()
 
     def show_home(self):
         """Display home page"""
@@ -144,13 +233,6 @@ class ResumeApp:
         uploaded_file = st.file_uploader("Upload your resume (PDF or DOCX)", type=['pdf', 'docx'])
         
         if uploaded_file is not None:
-            # Save the uploaded file temporarily
-            temp_path = os.path.join("temp", uploaded_file.name)
-            os.makedirs("temp", exist_ok=True)
-            
-            with open(temp_path, "wb") as f:
-                f.write(uploaded_file.getvalue())
-            
             # Get job role
             job_role = st.text_input("Enter the job role you're applying for", "Software Developer")
             
@@ -168,146 +250,136 @@ class ResumeApp:
                 st.session_state.candidate_name = None
             
             if st.button("Get AI Analysis"):
-                with st.spinner("Analyzing your resume..."):
-                    try:
-                        # Initialize analyzer
-                        analyzer = AIResumeAnalyzer()
-                        
-                        # Extract text from resume
-                        if uploaded_file.name.endswith('.pdf'):
-                            resume_text = analyzer.extract_text_from_pdf(uploaded_file)
-                        else:
-                            resume_text = analyzer.extract_text_from_docx(uploaded_file)
-                        
-                        if not resume_text:
-                            st.error("Could not extract text from the resume. Please ensure the file is not corrupted.")
-                            return
-                        
-                        # Analyze resume
-                        analysis_result = analyzer.analyze_resume(
-                            resume_text=resume_text,
-                            job_role=job_role,
-                            model=model
-                        )
-                        
-                        if analysis_result and not analysis_result.get('error'):
-                            # Store results in session state
-                            st.session_state.analysis_result = analysis_result
-                            st.session_state.candidate_name = os.path.splitext(uploaded_file.name)[0]
-                            st.session_state.ai_analysis_stats = analysis_result
-                            
-                            # Display results
-                            st.subheader("AI Analysis Results")
-                            
-                            # Display scores
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.metric("Resume Score", f"{analysis_result.get('score', 0)}%")
-                            with col2:
-                                st.metric("ATS Score", f"{analysis_result.get('ats_score', 0)}%")
-                            
-                            # Display strengths and weaknesses
-                            st.subheader("Key Strengths")
-                            for strength in analysis_result.get('strengths', []):
-                                st.write(f"✅ {strength}")
-                            
-                            st.subheader("Areas for Improvement")
-                            for weakness in analysis_result.get('weaknesses', []):
-                                st.write(f"⚠️ {weakness}")
-                            
-                            # Display detailed analysis
-                            st.subheader("Detailed Analysis")
-                            st.write(analysis_result.get('full_response', ''))
-                            
-                            # Add PDF report generation
-                            st.subheader("Download Analysis Report")
-                            if st.button("Generate PDF Report"):
-                                with st.spinner("Generating PDF report..."):
-                                    try:
-                                        # Generate PDF report
-                                        pdf_bytes = analyzer.generate_pdf_report(
-                                            analysis_result=st.session_state.analysis_result,
-                                            candidate_name=st.session_state.candidate_name,
-                                            job_role=job_role
-                                        )
-                                        
-                                        if pdf_bytes:
-                                            # Create download button
-                                            st.download_button(
-                                                label="Download PDF Report",
-                                                data=pdf_bytes.getvalue(),
-                                                file_name=f"{st.session_state.candidate_name}_Analysis_Report.pdf",
-                                                mime="application/pdf"
-                                            )
-                                            st.success("PDF report generated successfully!")
-                                        else:
-                                            st.error("Failed to generate PDF report. Please try again.")
-                                    except Exception as e:
-                                        st.error(f"Error generating PDF report: {str(e)}")
-                                        import traceback
-                                        st.code(traceback.format_exc())
-                        else:
-                            error_msg = analysis_result.get('error', 'Unknown error occurred')
-                            st.error(f"Error analyzing resume: {error_msg}")
-                            
-                    except Exception as e:
-                        st.error(f"Error analyzing resume: {str(e)}")
-                    finally:
-                        # Clean up temporary file
-                        if os.path.exists(temp_path):
-                            os.remove(temp_path)
-            
-            # Display results if they exist in session state
-            elif st.session_state.analysis_result:
-                st.subheader("AI Analysis Results")
-                
-                # Display scores
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Resume Score", f"{st.session_state.analysis_result.get('score', 0)}%")
-                with col2:
-                    st.metric("ATS Score", f"{st.session_state.analysis_result.get('ats_score', 0)}%")
-                
-                # Display strengths and weaknesses
-                st.subheader("Key Strengths")
-                for strength in st.session_state.analysis_result.get('strengths', []):
-                    st.write(f"✅ {strength}")
-                
-                st.subheader("Areas for Improvement")
-                for weakness in st.session_state.analysis_result.get('weaknesses', []):
-                    st.write(f"⚠️ {weakness}")
-                
-                # Display detailed analysis
-                st.subheader("Detailed Analysis")
-                st.write(st.session_state.analysis_result.get('full_response', ''))
-                
-                # Add PDF report generation
-                st.subheader("Download Analysis Report")
-                if st.button("Generate PDF Report"):
-                    with st.spinner("Generating PDF report..."):
-                        try:
-                            # Generate PDF report
-                            pdf_bytes = self.ai_analyzer.generate_pdf_report(
-                                analysis_result=st.session_state.analysis_result,
-                                candidate_name=st.session_state.candidate_name,
-                                job_role=job_role
-                            )
-                            
-                            if pdf_bytes:
-                                # Create download button
-                                st.download_button(
-                                    label="Download PDF Report",
-                                    data=pdf_bytes.getvalue(),
-                                    file_name=f"{st.session_state.candidate_name}_Analysis_Report.pdf",
-                                    mime="application/pdf"
+                try:
+                    analyzer = self.ai_analyzer
+
+                    # Extract text from resume (memoized on the file bytes)
+                    resume_text = _extract_text(uploaded_file.getvalue(), uploaded_file.name)
+
+                    if not resume_text:
+                        st.error("Could not extract text from the resume. Please ensure the file is not corrupted.")
+                        return
+
+                    # Reuse the previous response if the inputs are unchanged
+                    text_hash = hashlib.sha256(resume_text.encode()).hexdigest()
+                    analysis_key = (text_hash, job_role, model)
+
+                    if st.session_state.get('analysis_key') == analysis_key and st.session_state.analysis_result:
+                        analysis_result = st.session_state.analysis_result
+                    else:
+                        # Stream tokens as they arrive so the user sees
+                        # output immediately instead of waiting behind a
+                        # spinner for the full response
+                        stream_area = st.empty()
+                        with stream_area.container():
+                            st.subheader("Analyzing your resume...")
+                            full_response = st.write_stream(
+                                analyzer.analyze_resume_stream(
+                                    resume_text=resume_text,
+                                    job_role=job_role,
+                                    model=model
                                 )
-                                st.success("PDF report generated successfully!")
-                            else:
-                                st.error("Failed to generate PDF report. Please try again.")
-                        except Exception as e:
-                            st.error(f"Error generating PDF report: {str(e)}")
-                            import traceback
-                            st.code(traceback.format_exc())
+                            )
+                        stream_area.empty()
+
+                        # Label the result with the backend that actually
+                        # answered, which can differ from the selection
+                        # when a fallback kicked in
+                        analysis_result = analyzer.structure_analysis(
+                            full_response,
+                            getattr(analyzer, 'last_model_used', model)
+                        )
+                        # Failures are signaled out-of-band so a stream
+                        # that dies mid-response is never mistaken for a
+                        # complete analysis
+                        stream_error = getattr(analyzer, 'last_error', None)
+                        if stream_error:
+                            analysis_result['error'] = stream_error
+
+                    if analysis_result and not analysis_result.get('error'):
+                        # Store results in session state; the key is only
+                        # recorded alongside the result it belongs to, so a
+                        # failed run stays retryable and never pairs a new
+                        # key with a stale result
+                        st.session_state.analysis_key = analysis_key
+                        st.session_state.analysis_result = analysis_result
+                        st.session_state.candidate_name = os.path.splitext(uploaded_file.name)[0]
+                        st.session_state.ai_analysis_stats = analysis_result
+                    else:
+                        error_msg = analysis_result.get('error', 'Unknown error occurred')
+                        st.error(f"Error analyzing resume: {error_msg}")
+
+                except Exception as e:
+                    st.error(f"Error analyzing resume: {str(e)}")
+
+            # Render results from session state (fresh run or revisit)
+            if st.session_state.analysis_result:
+                self._render_analysis(st.session_state.analysis_result, job_role)
+
+    @_fragment
+    def _render_analysis(self, analysis_result, job_role):
+        """Render analysis results; as a fragment only this block reruns on the PDF button"""
+        # Bind the result fields once instead of repeating dict lookups
+        # through the render calls below
+        score = analysis_result.get('score', 0)
+        ats_score = analysis_result.get('ats_score', 0)
+        strengths = analysis_result.get('strengths', [])
+        weaknesses = analysis_result.get('weaknesses', [])
+        full_response = analysis_result.get('full_response', '')
+
+        st.subheader("AI Analysis Results")
+
+        # Display scores
+        col1, col2 = st.columns(2)
+        col1.metric("Resume Score", f"{score}%")
+        col2.metric("ATS Score", f"{ats_score}%")
+
+        # Display strengths and weaknesses as single markdown blobs — one
+        # front-end element per list instead of one widget per bullet
+        st.subheader("Key Strengths")
+        if strengths:
+            st.markdown("\n".join(f"- ✅ {strength}" for strength in strengths))
+
+        st.subheader("Areas for Improvement")
+        if weaknesses:
+            st.markdown("\n".join(f"- ⚠️ {weakness}" for weakness in weaknesses))
+
+        # Display detailed analysis
+        st.subheader("Detailed Analysis")
+        st.write(full_response)
+
+        # Add PDF report generation
+        st.subheader("Download Analysis Report")
+        if st.button("Generate PDF Report"):
+            with st.spinner("Generating PDF report..."):
+                try:
+                    # Generate PDF report (memoized on the analysis content)
+                    import json
+                    result_hash = hashlib.sha256(
+                        json.dumps(analysis_result, sort_keys=True, default=str).encode()
+                    ).hexdigest()
+                    pdf_bytes = _cached_pdf(
+                        result_hash,
+                        st.session_state.candidate_name,
+                        job_role,
+                        analysis_result
+                    )
+
+                    if pdf_bytes:
+                        # Create download button
+                        st.download_button(
+                            label="Download PDF Report",
+                            data=pdf_bytes,
+                            file_name=f"{st.session_state.candidate_name}_Analysis_Report.pdf",
+                            mime="application/pdf"
+                        )
+                        st.success("PDF report generated successfully!")
+                    else:
+                        st.error("Failed to generate PDF report. Please try again.")
+                except Exception as e:
+                    st.error(f"Error generating PDF report: {str(e)}")
+                    import traceback
+                    st.code(traceback.format_exc())
 
     def show_builder(self):
         """Display resume builder page"""
@@ -318,102 +390,120 @@ class ResumeApp:
             "Choose a template",
             ["Modern", "Professional", "Minimal", "Creative"]
         )
-        
-        # Personal Information
-        st.subheader("Personal Information")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            full_name = st.text_input("Full Name")
-            email = st.text_input("Email")
-            phone = st.text_input("Phone")
-        
-        with col2:
-            location = st.text_input("Location")
-            linkedin = st.text_input("LinkedIn Profile")
-            portfolio = st.text_input("Portfolio Website")
-        
-        # Professional Summary
-        st.subheader("Professional Summary")
-        summary = st.text_area("Write a brief summary of your professional background")
-        
-        # Experience
-        st.subheader("Work Experience")
-        experience = []
-        
+
+        # Row counts stay outside the form so adding an entry still
+        # updates the layout immediately
         num_experiences = st.number_input("Number of experiences", min_value=1, max_value=10, value=1)
-        
-        for i in range(num_experiences):
-            st.write(f"Experience {i+1}")
+        num_education = st.number_input("Number of education entries", min_value=1, max_value=5, value=1)
+
+        # All text widgets live in one form: edits no longer trigger a
+        # script rerun per keystroke, only the submit button does
+        with st.form("resume_builder_form"):
+            # Personal Information
+            st.subheader("Personal Information")
             col1, col2 = st.columns(2)
-            
+
             with col1:
-                company = st.text_input(f"Company {i+1}")
-                position = st.text_input(f"Position {i+1}")
-            
+                full_name = st.text_input("Full Name")
+                email = st.text_input("Email")
+                phone = st.text_input("Phone")
+
             with col2:
-                start_date = st.date_input(f"Start Date {i+1}")
-                end_date = st.date_input(f"End Date {i+1}")
-            
-            description = st.text_area(f"Description {i+1}")
-            
-            if company and position:
-                experience.append({
+                location = st.text_input("Location")
+                linkedin = st.text_input("LinkedIn Profile")
+                portfolio = st.text_input("Portfolio Website")
+
+            # Professional Summary
+            st.subheader("Professional Summary")
+            summary = st.text_area("Write a brief summary of your professional background")
+
+            # Experience: collect raw widget values here, build the final
+            # dicts only on submit
+            st.subheader("Work Experience")
+            experience_rows = []
+
+            for i in range(num_experiences):
+                st.write(f"Experience {i+1}")
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    company = st.text_input(f"Company {i+1}")
+                    position = st.text_input(f"Position {i+1}")
+
+                with col2:
+                    start_date = st.date_input(f"Start Date {i+1}")
+                    end_date = st.date_input(f"End Date {i+1}")
+
+                description = st.text_area(f"Description {i+1}")
+                experience_rows.append((company, position, start_date, end_date, description))
+
+            # Education
+            st.subheader("Education")
+            education_rows = []
+
+            for i in range(num_education):
+                st.write(f"Education {i+1}")
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    school = st.text_input(f"School {i+1}")
+                    degree = st.text_input(f"Degree {i+1}")
+
+                with col2:
+                    field = st.text_input(f"Field of Study {i+1}")
+                    graduation_date = st.date_input(f"Graduation Date {i+1}")
+                    gpa = st.text_input(f"GPA {i+1}")
+
+                education_rows.append((school, degree, field, graduation_date, gpa))
+
+            # Skills
+            st.subheader("Skills")
+
+            technical_skills = st.text_area("Technical Skills (comma-separated)")
+            soft_skills = st.text_area("Soft Skills (comma-separated)")
+            languages = st.text_area("Languages (comma-separated)")
+            tools = st.text_area("Tools & Technologies (comma-separated)")
+
+            submitted = st.form_submit_button("Generate Resume")
+
+        # Generate Resume
+        if submitted:
+            # Parse the skill lists only when actually generating, not on
+            # every rerun of the page
+            skills = {}
+            if technical_skills:
+                skills['technical'] = [s for s in _SKILL_SPLIT.split(technical_skills.strip()) if s]
+            if soft_skills:
+                skills['soft'] = [s for s in _SKILL_SPLIT.split(soft_skills.strip()) if s]
+            if languages:
+                skills['languages'] = [s for s in _SKILL_SPLIT.split(languages.strip()) if s]
+            if tools:
+                skills['tools'] = [s for s in _SKILL_SPLIT.split(tools.strip()) if s]
+
+            experience = [
+                {
                     'company': company,
                     'position': position,
-                    'start_date': start_date.strftime("%B %Y"),
-                    'end_date': end_date.strftime("%B %Y"),
+                    'start_date': _fmt_month_year(start_date),
+                    'end_date': _fmt_month_year(end_date),
                     'description': description
-                })
-        
-        # Education
-        st.subheader("Education")
-        education = []
-        
-        num_education = st.number_input("Number of education entries", min_value=1, max_value=5, value=1)
-        
-        for i in range(num_education):
-            st.write(f"Education {i+1}")
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                school = st.text_input(f"School {i+1}")
-                degree = st.text_input(f"Degree {i+1}")
-            
-            with col2:
-                field = st.text_input(f"Field of Study {i+1}")
-                graduation_date = st.date_input(f"Graduation Date {i+1}")
-                gpa = st.text_input(f"GPA {i+1}")
-            
-            if school and degree:
-                education.append({
+                }
+                for company, position, start_date, end_date, description in experience_rows
+                if company and position
+            ]
+
+            education = [
+                {
                     'school': school,
                     'degree': degree,
                     'field': field,
-                    'graduation_date': graduation_date.strftime("%B %Y"),
+                    'graduation_date': _fmt_month_year(graduation_date),
                     'gpa': gpa
-                })
-        
-        # Skills
-        st.subheader("Skills")
-        skills = {}
-        
-        technical_skills = st.text_area("Technical Skills (comma-separated)")
-        soft_skills = st.text_area("Soft Skills (comma-separated)")
-        languages = st.text_area("Languages (comma-separated)")
-        tools = st.text_area("Tools & Technologies (comma-separated)")
-        
-        if technical_skills:
-            skills['technical'] = [s.strip() for s in technical_skills.split(',')]
-        if soft_skills:
-            skills['soft'] = [s.strip() for s in soft_skills.split(',')]
-        if languages:
-            skills['languages'] = [s.strip() for s in languages.split(',')]
-        if tools:
-            skills['tools'] = [s.strip() for s in tools.split(',')]
-        
-        # Generate Resume
-        if st.button("Generate Resume"):
+                }
+                for school, degree, field, graduation_date, gpa in education_rows
+                if school and degree
+            ]
+
             resume_data = {
                 'template': template,
                 'personal_info': {
@@ -450,11 +540,14 @@ class ResumeApp:
 
     def show_dashboard(self):
         """Display dashboard page"""
+        import pandas as pd
+
         st.title("Dashboard")
-        
+
         try:
-            # Get AI analysis statistics
-            stats = self.ai_analyzer.get_ai_analysis_statistics()
+            # One cached fetch covers statistics and recent analyses
+            payload = _dashboard_payload()
+            stats = payload['stats']
             
             if stats and stats.get('total_analyses', 0) > 0:
                 # Overall Statistics
@@ -468,34 +561,28 @@ class ResumeApp:
                     # Model Usage Distribution
                     st.subheader("Model Usage")
                     if stats['model_usage']:
-                        model_data = pd.DataFrame({
-                            'Model': list(stats['model_usage'].keys()),
-                            'Count': list(stats['model_usage'].values())
-                        })
-                        st.bar_chart(model_data.set_index('Model'))
+                        st.bar_chart(pd.Series(stats['model_usage'], name='Count').rename_axis('Model'))
                     else:
                         st.info("No model usage data available")
-                
+
                 # Job Role Distribution
                 st.subheader("Job Role Distribution")
                 if stats['job_roles']:
-                    role_data = pd.DataFrame({
-                        'Role': list(stats['job_roles'].keys()),
-                        'Count': list(stats['job_roles'].values())
-                    })
-                    st.bar_chart(role_data.set_index('Role'))
+                    st.bar_chart(pd.Series(stats['job_roles'], name='Count').rename_axis('Role'))
                 else:
                     st.info("No job role data available")
                 
                 # Recent Analyses
                 st.subheader("Recent Analyses")
-                recent_analyses = self.ai_analyzer.get_recent_analyses(limit=5)
+                recent_analyses = payload['recent']
                 if recent_analyses:
-                    for analysis in recent_analyses:
-                        with st.expander(f"Analysis from {analysis['created_at']}"):
-                            st.write(f"Job Role: {analysis['job_role']}")
-                            st.write(f"Resume Score: {analysis['resume_score']}%")
-                            st.write(f"Model Used: {analysis['model_used']}")
+                    # One Arrow-serialized table instead of an expander
+                    # widget per row
+                    recent_df = pd.DataFrame(
+                        recent_analyses,
+                        columns=['created_at', 'job_role', 'resume_score', 'model_used']
+                    )
+                    st.dataframe(recent_df, use_container_width=True, hide_index=True)
                 else:
                     st.info("No recent analyses available")
             else:
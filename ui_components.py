@@ -1,8 +1,9 @@
+import functools
+import html
+
 import streamlit as st
 
-def apply_modern_styles():
-    """Apply modern styles to the application"""
-    st.markdown("""
+_STYLE_HTML = """
     <style>
         /* Modern UI Components */
         .stApp {
@@ -148,37 +149,89 @@ def apply_modern_styles():
         ::-webkit-scrollbar-thumb:hover {
             background: #FF8E8E;
         }
-    </style>
-    """, unsafe_allow_html=True)
 
-def hero_section():
-    """Render the hero section with your name"""
-    st.markdown("""
-    <div class="main-header">
-        <h1>Smart Resume AI</h1>
-        <p>Powered by Advanced AI Technology</p>
-        <p style="font-size: 1rem; margin-top: 2rem;">Created by ABINIVAS</p>
-    </div>
-    """, unsafe_allow_html=True)
+        /* About section */
+        .about-section {
+            background: linear-gradient(135deg, #2D2D2D 0%, #1E1E1E 100%);
+            border-radius: 20px;
+            padding: 3rem 2rem;
+            margin: 2rem 0;
+            position: relative;
+            overflow: hidden;
+        }
 
-def feature_card(title, description, icon):
-    """Render a feature card with modern styling"""
-    st.markdown(f"""
-    <div class="feature-card">
-        <h2>{icon} {title}</h2>
-        <p>{description}</p>
-    </div>
-    """, unsafe_allow_html=True)
+        .about-section::before {
+            content: '';
+            position: absolute;
+            top: -50%;
+            left: -50%;
+            width: 200%;
+            height: 200%;
+            background: radial-gradient(circle, rgba(0,180,219,0.1) 0%, transparent 70%);
+            animation: rotate 20s linear infinite;
+        }
 
-def about_section():
-    """Render the about section with your name"""
-    st.markdown("""
-    <div class="feature-card">
-        <h2>About Smart Resume AI</h2>
-        <p>Smart Resume AI is an advanced resume analysis and optimization tool that helps job seekers create ATS-friendly resumes and improve their chances of landing interviews.</p>
-        <p style="margin-top: 1rem; font-style: italic;">Developed with ❤️ by ABINIVAS</p>
-    </div>
-    """, unsafe_allow_html=True)
+        .about-section h2 {
+            color: #E0E0E0;
+            margin-bottom: 1.5rem;
+            font-size: 2rem;
+        }
+
+        .about-description {
+            color: #B0B0B0;
+            line-height: 1.6;
+            font-size: 1.1rem;
+            max-width: 800px;
+            margin-bottom: 2rem;
+        }
+
+        .team-section {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 1.5rem;
+            margin-top: 2rem;
+        }
+
+        .team-member {
+            background: #2D2D2D;
+            border-radius: 15px;
+            padding: 1.5rem;
+            text-align: center;
+            border: 1px solid #3D3D3D;
+            transition: all 0.3s ease;
+        }
+
+        .team-member:hover {
+            transform: translateY(-5px);
+            border-color: #00B4DB;
+        }
+
+        .team-member img {
+            width: 120px;
+            height: 120px;
+            border-radius: 50%;
+            margin-bottom: 1rem;
+        }
+
+        .team-member h3 {
+            color: #E0E0E0;
+            margin-bottom: 0.5rem;
+        }
+
+        .team-member p {
+            color: #B0B0B0;
+        }
+    </style>
+    """
+
+def apply_modern_styles():
+    """Apply modern styles to the application
+
+    The blob must be re-emitted on every rerun -- Streamlit drops any
+    element that is not re-rendered -- but building it once at module
+    scope keeps the per-call cost to a single markdown emission.
+    """
+    st.markdown(_STYLE_HTML, unsafe_allow_html=True)
 
 def page_header(title, subtitle=None):
     """Render a consistent page header with gradient background"""
@@ -210,90 +263,89 @@ def hero_section(title, subtitle=None, description=None):
         unsafe_allow_html=True
     )
 
-def feature_card(icon, title, description):
-    """Render a modern feature card with hover effects"""
-    st.markdown(f"""
-        <div class="card feature-card">
-            <div class="feature-icon icon-pulse">
-                <i class="{icon}"></i>
-            </div>
-            <h3>{title}</h3>
-            <p>{description}</p>
+# Card templates are built once at import; per-call work is reduced to
+# placeholder substitution via str.format_map
+_FEATURE_TPL = """
+    <div class="card feature-card">
+        <div class="feature-icon icon-pulse">
+            <i class="{icon}"></i>
         </div>
-    """, unsafe_allow_html=True)
+        <h3>{title}</h3>
+        <p>{description}</p>
+    </div>
+"""
 
-def about_section(content, image_path=None, social_links=None):
-    """Render a modern about section with profile image and social links"""
-    st.markdown("""
-        <div class="glass-card about-section">
-            <div class="profile-section">
-    """, unsafe_allow_html=True)
-    
-    # Profile Image
-    if image_path:
-        st.image(image_path, use_column_width=False, width=200)
-    
-    # Image Upload
-    uploaded_file = st.file_uploader("Upload profile picture", type=['png', 'jpg', 'jpeg'])
-    if uploaded_file is not None:
-        st.image(uploaded_file, use_column_width=False, width=200)
-    
-    # Social Links
-    if social_links:
-        st.markdown('<div class="social-links">', unsafe_allow_html=True)
-        for platform, url in social_links.items():
-            st.markdown(f'<a href="{url}" target="_blank" class="social-link"><i class="fab fa-{platform.lower()}"></i></a>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # About Content
-    st.markdown(f"""
-            </div>
-            <div class="about-content">{content}</div>
+_METRIC_TPL = """
+    <div class="metric-card">
+        <div class="metric-header">
+            {icon_html}
+            <div class="metric-label">{label}</div>
         </div>
-    """, unsafe_allow_html=True)
+        <div class="metric-value">{value}</div>
+        {delta_html}
+    </div>
+"""
 
-def metric_card(label, value, delta=None, icon=None):
-    """Render a modern metric card with animations"""
+_TEMPLATE_TPL = """
+    <div class="glass-card template-card">
+        {image_html}
+        <h3>{title}</h3>
+        <p>{description}</p>
+        <div class="card-overlay"></div>
+    </div>
+"""
+
+_FEEDBACK_TPL = """
+    <div class="card feedback-card">
+        <div class="feedback-header">
+            <div class="feedback-name">{name}</div>
+            <div class="feedback-rating">{stars}</div>
+        </div>
+        <p class="feedback-text">{feedback}</p>
+    </div>
+"""
+
+# The card helpers are typically called with the same static arguments on
+# every rerun, so the HTML assembly is memoized and the render functions
+# only push the cached blob to the frontend
+@functools.lru_cache(maxsize=256)
+def _feature_card_html(icon, title, description):
+    return _FEATURE_TPL.format_map(locals())
+
+def feature_card(icon, title, description):
+    """Render a modern feature card with hover effects"""
+    st.markdown(_feature_card_html(icon, title, description), unsafe_allow_html=True)
+
+@functools.lru_cache(maxsize=256)
+def _metric_card_html(label, value, delta, icon):
     icon_html = f'<i class="{icon}"></i>' if icon else ''
     delta_html = f'<div class="metric-delta">{delta}</div>' if delta else ''
-    
-    st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-header">
-                {icon_html}
-                <div class="metric-label">{label}</div>
-            </div>
-            <div class="metric-value">{value}</div>
-            {delta_html}
-        </div>
-    """, unsafe_allow_html=True)
+    return _METRIC_TPL.format_map(locals())
+
+def metric_card(label, value, delta=None, icon=None):
+    """Render a modern metric card with animations"""
+    st.markdown(_metric_card_html(label, value, delta, icon), unsafe_allow_html=True)
+
+@functools.lru_cache(maxsize=256)
+def _template_card_html(title, description, image_url):
+    image_html = f'<img src="{image_url}" class="template-image" />' if image_url else ''
+    return _TEMPLATE_TPL.format_map(locals())
 
 def template_card(title, description, image_url=None):
     """Render a modern template card with glassmorphism effect"""
-    image_html = f'<img src="{image_url}" class="template-image" />' if image_url else ''
-    
-    st.markdown(f"""
-        <div class="glass-card template-card">
-            {image_html}
-            <h3>{title}</h3>
-            <p>{description}</p>
-            <div class="card-overlay"></div>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_template_card_html(title, description, image_url), unsafe_allow_html=True)
+
+# Ratings are bounded 0-5, so the star strings are precomputed once
+_STARS = tuple("⭐" * i for i in range(6))
+
+@functools.lru_cache(maxsize=256)
+def _feedback_card_html(name, feedback, rating):
+    stars = _STARS[max(0, min(5, int(rating)))]
+    return _FEEDBACK_TPL.format_map(locals())
 
 def feedback_card(name, feedback, rating):
     """Render a modern feedback card with rating stars"""
-    stars = "⭐" * int(rating)
-    
-    st.markdown(f"""
-        <div class="card feedback-card">
-            <div class="feedback-header">
-                <div class="feedback-name">{name}</div>
-                <div class="feedback-rating">{stars}</div>
-            </div>
-            <p class="feedback-text">{feedback}</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_feedback_card_html(name, feedback, rating), unsafe_allow_html=True)
 
 def loading_spinner(message="Loading..."):
     """Show a modern loading spinner with message"""
@@ -319,22 +371,26 @@ def progress_bar(value, max_value, label=None):
         </div>
     """, unsafe_allow_html=True)
 
-def tooltip(content, tooltip_text):
-    """Render content with a modern tooltip"""
-    st.markdown(f"""
+@functools.lru_cache(maxsize=256)
+def _tooltip_html(content, tooltip_text):
+    return f"""
         <div class="tooltip" data-tooltip="{tooltip_text}">
             {content}
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+def tooltip(content, tooltip_text):
+    """Render content with a modern tooltip"""
+    st.markdown(_tooltip_html(content, tooltip_text), unsafe_allow_html=True)
 
 def data_table(data, headers):
     """Render a modern data table with hover effects"""
-    header_row = "".join([f"<th>{header}</th>" for header in headers])
-    rows = ""
-    for row in data:
-        cells = "".join([f"<td>{cell}</td>" for cell in row])
-        rows += f"<tr>{cells}</tr>"
-    
+    header_row = "".join(f"<th>{html.escape(str(header))}</th>" for header in headers)
+    rows = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + "</tr>"
+        for row in data
+    )
+
     st.markdown(f"""
         <div class="table-container">
             <table class="modern-table">
@@ -348,94 +404,26 @@ def data_table(data, headers):
         </div>
     """, unsafe_allow_html=True)
 
+# Wrapper built once; %-interpolation fills the single slot at C level
+_GRID = '<div class="grid">%s</div>'
+
 def grid_layout(*elements):
-    """Create a responsive grid layout"""
-    st.markdown("""
-        <div class="grid">
-            {}
-        </div>
-    """.format("".join(elements)), unsafe_allow_html=True)
+    """Create a responsive grid layout (elements are pre-built HTML)"""
+    st.markdown(_GRID % "".join(elements), unsafe_allow_html=True)
+
+_ABOUT_TPL = """
+    <div class="about-section">
+        <h2>{title}</h2>
+        <p class="about-description">{description}</p>
+        {team_html}
+    </div>
+"""
 
 def about_section(title, description, team_members=None):
-    st.markdown(f"""
-        <div class="about-section">
-            <h2>{title}</h2>
-            <p class="about-description">{description}</p>
-            {generate_team_section(team_members) if team_members else ''}
-        </div>
-        <style>
-            .about-section {{
-                background: linear-gradient(135deg, #2D2D2D 0%, #1E1E1E 100%);
-                border-radius: 20px;
-                padding: 3rem 2rem;
-                margin: 2rem 0;
-                position: relative;
-                overflow: hidden;
-            }}
-            
-            .about-section::before {{
-                content: '';
-                position: absolute;
-                top: -50%;
-                left: -50%;
-                width: 200%;
-                height: 200%;
-                background: radial-gradient(circle, rgba(0,180,219,0.1) 0%, transparent 70%);
-                animation: rotate 20s linear infinite;
-            }}
-            
-            .about-section h2 {{
-                color: #E0E0E0;
-                margin-bottom: 1.5rem;
-                font-size: 2rem;
-            }}
-            
-            .about-description {{
-                color: #B0B0B0;
-                line-height: 1.6;
-                font-size: 1.1rem;
-                max-width: 800px;
-                margin-bottom: 2rem;
-            }}
-            
-            .team-section {{
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                gap: 1.5rem;
-                margin-top: 2rem;
-            }}
-            
-            .team-member {{
-                background: #2D2D2D;
-                border-radius: 15px;
-                padding: 1.5rem;
-                text-align: center;
-                border: 1px solid #3D3D3D;
-                transition: all 0.3s ease;
-            }}
-            
-            .team-member:hover {{
-                transform: translateY(-5px);
-                border-color: #00B4DB;
-            }}
-            
-            .team-member img {{
-                width: 120px;
-                height: 120px;
-                border-radius: 50%;
-                margin-bottom: 1rem;
-            }}
-            
-            .team-member h3 {{
-                color: #E0E0E0;
-                margin-bottom: 0.5rem;
-            }}
-            
-            .team-member p {{
-                color: #B0B0B0;
-            }}
-        </style>
-    """, unsafe_allow_html=True)
+    # Styling lives in _STYLE_HTML (injected once); only the HTML is
+    # rendered per call
+    team_html = generate_team_section(team_members) if team_members else ''
+    st.markdown(_ABOUT_TPL.format_map(locals()), unsafe_allow_html=True)
 
 def generate_team_section(team_members):
     if not team_members:
@@ -458,31 +446,45 @@ def render_feedback(feedback_data):
     if not feedback_data:
         return
     
-    feedback_html = """
-    <div class="feedback-section">
-        <h3 class="feedback-header">Resume Analysis Feedback</h3>
-        <div class="feedback-content">
-    """
-    
-    for category, items in feedback_data.items():
-        if items:  # Only show categories with feedback
-            for item in items:
-                feedback_html += f"""
-                <div class="feedback-item">
-                    <div class="feedback-category">{category}</div>
-                    <div class="feedback-description">{item}</div>
-                </div>
-                """
-    
-    feedback_html += """
+    # Collect fragments and join once instead of growing a string in the loop
+    parts = [
+        '<div class="feedback-section">'
+        '<h3 class="feedback-header">Resume Analysis Feedback</h3>'
+        '<div class="feedback-content">'
+    ]
+    parts.extend(
+        f'<div class="feedback-item">'
+        f'<div class="feedback-category">{category}</div>'
+        f'<div class="feedback-description">{item}</div>'
+        f'</div>'
+        for category, items in feedback_data.items() if items  # Only show categories with feedback
+        for item in items
+    )
+    parts.append('</div></div>')
+
+    st.markdown("".join(parts), unsafe_allow_html=True)
+
+# One card template shared by all three analytics metrics
+_ANALYTICS_CARD_TPL = """
+    <div style='background: rgba(0, 20, 30, 0.3); border-radius: 15px; padding: 2rem; text-align: center; margin-bottom: 1rem;'>
+        <div style='color: #00bfa5; font-size: 2.5rem; margin-bottom: 1rem;'>
+            <i class='{icon}'></i>
         </div>
+        <h2 style='color: white; font-size: 1.5rem; margin-bottom: 1rem;'>{label}</h2>
+        <p style='color: #00bfa5; font-size: 2.5rem; font-weight: bold; margin: 0;'>{value}</p>
     </div>
-    """
-    
-    st.markdown(feedback_html, unsafe_allow_html=True)
+"""
+
+# Lightweight skeleton flashed into each dashboard section's placeholder
+# before the real HTML is built, so the page paints without waiting on it
+_SKELETON_HTML = """
+    <div style='background: rgba(0, 20, 30, 0.3); border-radius: 15px; padding: 2rem; min-height: 8rem; opacity: 0.4;'></div>
+"""
 
 def render_analytics_section(resume_uploaded=False, metrics=None):
     """Render the analytics section of the dashboard"""
+    placeholder = st.empty()
+    placeholder.markdown(_SKELETON_HTML, unsafe_allow_html=True)
     if not metrics:
         metrics = {
             'views': 0,
@@ -490,89 +492,69 @@ def render_analytics_section(resume_uploaded=False, metrics=None):
             'score': 'N/A'
         }
     
-    # Views Card
-    st.markdown("""
-        <div style='background: rgba(0, 20, 30, 0.3); border-radius: 15px; padding: 2rem; text-align: center; margin-bottom: 1rem;'>
-            <div style='color: #00bfa5; font-size: 2.5rem; margin-bottom: 1rem;'>
-                <i class='fas fa-eye'></i>
-            </div>
-            <h2 style='color: white; font-size: 1.5rem; margin-bottom: 1rem;'>Resume Views</h2>
-            <p style='color: #00bfa5; font-size: 2.5rem; font-weight: bold; margin: 0;'>{}</p>
-        </div>
-    """.format(metrics['views']), unsafe_allow_html=True)
-    
-    # Downloads Card
-    st.markdown("""
-        <div style='background: rgba(0, 20, 30, 0.3); border-radius: 15px; padding: 2rem; text-align: center; margin-bottom: 1rem;'>
-            <div style='color: #00bfa5; font-size: 2.5rem; margin-bottom: 1rem;'>
-                <i class='fas fa-download'></i>
-            </div>
-            <h2 style='color: white; font-size: 1.5rem; margin-bottom: 1rem;'>Downloads</h2>
-            <p style='color: #00bfa5; font-size: 2.5rem; font-weight: bold; margin: 0;'>{}</p>
-        </div>
-    """.format(metrics['downloads']), unsafe_allow_html=True)
-    
-    # Profile Score Card
-    st.markdown("""
-        <div style='background: rgba(0, 20, 30, 0.3); border-radius: 15px; padding: 2rem; text-align: center; margin-bottom: 1rem;'>
-            <div style='color: #00bfa5; font-size: 2.5rem; margin-bottom: 1rem;'>
-                <i class='fas fa-chart-line'></i>
-            </div>
-            <h2 style='color: white; font-size: 1.5rem; margin-bottom: 1rem;'>Profile Score</h2>
-            <p style='color: #00bfa5; font-size: 2.5rem; font-weight: bold; margin: 0;'>{}</p>
-        </div>
-    """.format(metrics['score']), unsafe_allow_html=True)
+    # All three cards go out in one markdown emission: one websocket
+    # frame and DOM diff instead of three
+    cards = (
+        ('fas fa-eye', 'Resume Views', metrics['views']),
+        ('fas fa-download', 'Downloads', metrics['downloads']),
+        ('fas fa-chart-line', 'Profile Score', metrics['score']),
+    )
+    placeholder.markdown(
+        "".join(_ANALYTICS_CARD_TPL.format(icon=icon, label=label, value=value)
+                for icon, label, value in cards),
+        unsafe_allow_html=True
+    )
 
 def render_activity_section(resume_uploaded=False):
     """Render the recent activity section"""
-    st.markdown("""
-        <div style='background: rgba(0, 20, 30, 0.3); border-radius: 15px; padding: 2rem; height: 100%;'>
-            <h2 style='color: white; font-size: 1.5rem; margin-bottom: 1.5rem;'>
-                <i class='fas fa-history' style='color: #00bfa5; margin-right: 0.5rem;'></i> Recent Activity
-            </h2>
-    """, unsafe_allow_html=True)
-    
+    placeholder = st.empty()
+    placeholder.markdown(_SKELETON_HTML, unsafe_allow_html=True)
     if resume_uploaded:
-        st.markdown("""
+        body = """
             <div style='color: #ddd;'>
                 <p style='margin: 0.8rem 0; font-size: 1.1rem;'>• Resume uploaded and analyzed</p>
                 <p style='margin: 0.8rem 0; font-size: 1.1rem;'>• Generated optimization suggestions</p>
                 <p style='margin: 0.8rem 0; font-size: 1.1rem;'>• Updated profile score</p>
             </div>
-        """, unsafe_allow_html=True)
+        """
     else:
-        st.markdown("""
+        body = """
             <div style='text-align: center; padding: 2rem; color: #666;'>
                 <i class='fas fa-upload' style='font-size: 2.5rem; color: #00bfa5; margin-bottom: 1rem;'></i>
                 <p style='margin: 0; font-size: 1.1rem;'>Upload your resume to see activity</p>
             </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("</div>", unsafe_allow_html=True)
+        """
 
-def render_suggestions_section(resume_uploaded=False):
-    """Render the suggestions section"""
-    st.markdown("""
+    placeholder.markdown("""
         <div style='background: rgba(0, 20, 30, 0.3); border-radius: 15px; padding: 2rem; height: 100%;'>
             <h2 style='color: white; font-size: 1.5rem; margin-bottom: 1.5rem;'>
-                <i class='fas fa-lightbulb' style='color: #00bfa5; margin-right: 0.5rem;'></i> Suggestions
+                <i class='fas fa-history' style='color: #00bfa5; margin-right: 0.5rem;'></i> Recent Activity
             </h2>
-    """, unsafe_allow_html=True)
-    
+    """ + body + "</div>", unsafe_allow_html=True)
+
+def render_suggestions_section(resume_uploaded=False):
+    """Render the suggestions section"""
+    placeholder = st.empty()
+    placeholder.markdown(_SKELETON_HTML, unsafe_allow_html=True)
     if resume_uploaded:
-        st.markdown("""
+        body = """
             <div style='color: #ddd;'>
                 <p style='margin: 0.8rem 0; font-size: 1.1rem;'>• Add more quantifiable achievements</p>
                 <p style='margin: 0.8rem 0; font-size: 1.1rem;'>• Include relevant keywords</p>
                 <p style='margin: 0.8rem 0; font-size: 1.1rem;'>• Optimize formatting</p>
             </div>
-        """, unsafe_allow_html=True)
+        """
     else:
-        st.markdown("""
+        body = """
             <div style='text-align: center; padding: 2rem; color: #666;'>
                 <i class='fas fa-file-alt' style='font-size: 2.5rem; color: #00bfa5; margin-bottom: 1rem;'></i>
                 <p style='margin: 0; font-size: 1.1rem;'>Upload your resume to get suggestions</p>
             </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("</div>", unsafe_allow_html=True)
\ No newline at end of file
+        """
+
+    placeholder.markdown("""
+        <div style='background: rgba(0, 20, 30, 0.3); border-radius: 15px; padding: 2rem; height: 100%;'>
+            <h2 style='color: white; font-size: 1.5rem; margin-bottom: 1.5rem;'>
+                <i class='fas fa-lightbulb' style='color: #00bfa5; margin-right: 0.5rem;'></i> Suggestions
+            </h2>
+    """ + body + "</div>", unsafe_allow_html=True)
\ No newline at end of file
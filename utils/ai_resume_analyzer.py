@@ -6,6 +6,7 @@ import pdfplumber
 from pdf2image import convert_from_path
 import pytesseract
 import tempfile
+import datetime
 import requests
 import json
 import math
@@ -34,6 +35,47 @@ def clean_markdown(text):
     
     return text.strip()
 
+# Static analysis rubric sent with every Gemini request. Kept as a stable
+# prefix (system instruction / cached content) so repeated calls can reuse
+# it instead of re-sending and re-paying for it per request.
+ANALYSIS_RUBRIC = """
+You are an expert resume analyst with deep knowledge of industry standards, job requirements, and hiring practices across various fields. Your task is to provide a comprehensive, detailed analysis of the resume provided.
+
+Please structure your response in the following format:
+
+## Overall Assessment
+[Provide a detailed assessment of the resume's overall quality, effectiveness, and alignment with industry standards. Include specific observations about formatting, content organization, and general impression. Be thorough and specific.]
+
+## Professional Profile Analysis
+[Analyze the candidate's professional profile, experience trajectory, and career narrative. Discuss how well their story comes across and whether their career progression makes sense for their apparent goals.]
+
+## Skills Analysis
+- **Current Skills**: [List ALL skills the candidate demonstrates in their resume, categorized by type (technical, soft, domain-specific, etc.). Be comprehensive.]
+- **Skill Proficiency**: [Assess the apparent level of expertise in key skills based on how they're presented in the resume]
+- **Missing Skills**: [List important skills that would improve the resume for their target role. Be specific and explain why each skill matters.]
+
+## Experience Analysis
+[Provide detailed feedback on how well the candidate has presented their experience. Analyze the use of action verbs, quantifiable achievements, and relevance to their target role. Suggest specific improvements.]
+
+## Education Analysis
+[Analyze the education section, including relevance of degrees, certifications, and any missing educational elements that would strengthen their profile.]
+
+## Key Strengths
+[List 5-7 specific strengths of the resume with detailed explanations of why these are effective]
+
+## Areas for Improvement
+[List 5-7 specific areas where the resume could be improved with detailed, actionable recommendations]
+
+## ATS Optimization Assessment
+[Analyze how well the resume is optimized for Applicant Tracking Systems. Provide a specific ATS score from 0-100, with 100 being perfectly optimized. Use this format: "ATS Score: XX/100". Then suggest specific keywords and formatting changes to improve ATS performance.]
+
+## Recommended Courses/Certifications
+[Suggest 5-7 specific courses or certifications that would enhance the candidate's profile, with a brief explanation of why each would be valuable]
+
+## Resume Score
+[Provide a score from 0-100 based on the overall quality of the resume. Use this format exactly: "Resume Score: XX/100" where XX is the numerical score. Be consistent with your assessment - a resume with significant issues should score below 60, an average resume 60-75, a good resume 75-85, and an excellent resume 85-100.]
+"""
+
 class AIResumeAnalyzer:
     def __init__(self):
         # Load environment variables from Streamlit secrets
@@ -48,26 +90,70 @@ class AIResumeAnalyzer:
         
         # Configure Google Gemini AI
         genai.configure(api_key=self.google_api_key)
-        
-        # Initialize the model
-        self.model = genai.GenerativeModel("gemini-1.5-flash")
+
+        # Initialize the model with the static rubric as system instruction so
+        # only the variable resume/role text travels in each user message.
+        # Explicit context caching is deliberately not used: the rubric is
+        # below Gemini's minimum cacheable token count, and a CachedContent
+        # TTL would outlive this @st.cache_resource-cached instance anyway.
+        self.model = genai.GenerativeModel(
+            "gemini-1.5-flash",
+            system_instruction=ANALYSIS_RUBRIC,
+        )
     
+    def _fast_extract_text_from_pdf(self, pdf_bytes):
+        """Extract text from PDF bytes using pypdfium2 or PyMuPDF (much faster than pdfplumber)"""
+        from io import BytesIO
+
+        # Try pypdfium2 first
+        try:
+            import pypdfium2 as pdfium
+            pdf = pdfium.PdfDocument(BytesIO(pdf_bytes))
+            try:
+                return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+            finally:
+                pdf.close()
+        except ImportError:
+            pass
+        except Exception:
+            pass
+
+        # Fall back to PyMuPDF
+        try:
+            import fitz
+            with fitz.open(stream=pdf_bytes, filetype='pdf') as doc:
+                return "\n".join(page.get_text() for page in doc)
+        except ImportError:
+            pass
+        except Exception:
+            pass
+
+        return ""
+
     def extract_text_from_pdf(self, pdf_file):
-        """Extract text from PDF using pdfplumber and OCR if needed"""
+        """Extract text from PDF using pypdfium2/PyMuPDF, falling back to pdfplumber and OCR"""
         text = ""
-        
-        # Save the uploaded file to a temporary file
+
+        # Read the uploaded file into bytes once
+        if hasattr(pdf_file, 'getbuffer'):
+            pdf_bytes = bytes(pdf_file.getbuffer())
+        elif hasattr(pdf_file, 'read'):
+            pdf_bytes = pdf_file.read()
+            pdf_file.seek(0)  # Reset file pointer
+        else:
+            # If it's already bytes
+            pdf_bytes = pdf_file
+
+        # Try the fast backends first; they cover most text-based PDFs
+        fast_text = self._fast_extract_text_from_pdf(pdf_bytes)
+        if fast_text.strip():
+            return fast_text.strip()
+
+        # Save to a temporary file for the slower path (pdfplumber/OCR need a path)
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            if hasattr(pdf_file, 'getbuffer'):
-                temp_file.write(pdf_file.getbuffer())
-            elif hasattr(pdf_file, 'read'):
-                temp_file.write(pdf_file.read())
-                pdf_file.seek(0)  # Reset file pointer
-            else:
-                # If it's already bytes
-                temp_file.write(pdf_file)
+            temp_file.write(pdf_bytes)
             temp_path = temp_file.name
-        
+
         try:
             # Try direct text extraction with pdfplumber
             try:
@@ -209,77 +295,47 @@ class AIResumeAnalyzer:
         os.unlink(temp_path)  # Clean up the temp file
         return text
     
+    def _build_analysis_prompt(self, resume_text, job_description=None, job_role=None):
+        """Build the per-request prompt (the static rubric lives in the cached system instruction)"""
+        base_prompt = f"""
+        Resume:
+        {resume_text}
+        """
+
+        if job_role:
+            base_prompt += f"""
+
+            The candidate is targeting a role as: {job_role}
+
+            ## Role Alignment Analysis
+            [Analyze how well the resume aligns with the target role of {job_role}. Provide specific recommendations to better align the resume with this role.]
+            """
+
+        if job_description:
+            base_prompt += f"""
+
+            Additionally, compare this resume to the following job description:
+
+            Job Description:
+            {job_description}
+
+            ## Job Match Analysis
+            [Provide a detailed analysis of how well the resume matches the job description, with a match percentage and specific areas of alignment and misalignment]
+
+            ## Key Job Requirements Not Met
+            [List specific requirements from the job description that are not addressed in the resume, with recommendations on how to address each gap]
+            """
+
+        return base_prompt
+
     def analyze_resume_with_gemini(self, resume_text, job_description=None, job_role=None):
         """Analyze resume using Google Gemini AI"""
         if not resume_text:
             return {"error": "Resume text is required for analysis."}
-        
+
         try:
-            base_prompt = f"""
-            You are an expert resume analyst with deep knowledge of industry standards, job requirements, and hiring practices across various fields. Your task is to provide a comprehensive, detailed analysis of the resume provided.
-            
-            Please structure your response in the following format:
-            
-            ## Overall Assessment
-            [Provide a detailed assessment of the resume's overall quality, effectiveness, and alignment with industry standards. Include specific observations about formatting, content organization, and general impression. Be thorough and specific.]
-            
-            ## Professional Profile Analysis
-            [Analyze the candidate's professional profile, experience trajectory, and career narrative. Discuss how well their story comes across and whether their career progression makes sense for their apparent goals.]
-            
-            ## Skills Analysis
-            - **Current Skills**: [List ALL skills the candidate demonstrates in their resume, categorized by type (technical, soft, domain-specific, etc.). Be comprehensive.]
-            - **Skill Proficiency**: [Assess the apparent level of expertise in key skills based on how they're presented in the resume]
-            - **Missing Skills**: [List important skills that would improve the resume for their target role. Be specific and explain why each skill matters.]
-            
-            ## Experience Analysis
-            [Provide detailed feedback on how well the candidate has presented their experience. Analyze the use of action verbs, quantifiable achievements, and relevance to their target role. Suggest specific improvements.]
-            
-            ## Education Analysis
-            [Analyze the education section, including relevance of degrees, certifications, and any missing educational elements that would strengthen their profile.]
-            
-            ## Key Strengths
-            [List 5-7 specific strengths of the resume with detailed explanations of why these are effective]
-            
-            ## Areas for Improvement
-            [List 5-7 specific areas where the resume could be improved with detailed, actionable recommendations]
-            
-            ## ATS Optimization Assessment
-            [Analyze how well the resume is optimized for Applicant Tracking Systems. Provide a specific ATS score from 0-100, with 100 being perfectly optimized. Use this format: "ATS Score: XX/100". Then suggest specific keywords and formatting changes to improve ATS performance.]
-            
-            ## Recommended Courses/Certifications
-            [Suggest 5-7 specific courses or certifications that would enhance the candidate's profile, with a brief explanation of why each would be valuable]
-            
-            ## Resume Score
-            [Provide a score from 0-100 based on the overall quality of the resume. Use this format exactly: "Resume Score: XX/100" where XX is the numerical score. Be consistent with your assessment - a resume with significant issues should score below 60, an average resume 60-75, a good resume 75-85, and an excellent resume 85-100.]
-            
-            Resume:
-            {resume_text}
-            """
-            
-            if job_role:
-                base_prompt += f"""
-                
-                The candidate is targeting a role as: {job_role}
-                
-                ## Role Alignment Analysis
-                [Analyze how well the resume aligns with the target role of {job_role}. Provide specific recommendations to better align the resume with this role.]
-                """
-            
-            if job_description:
-                base_prompt += f"""
-                
-                Additionally, compare this resume to the following job description:
-                
-                Job Description:
-                {job_description}
-                
-                ## Job Match Analysis
-                [Provide a detailed analysis of how well the resume matches the job description, with a match percentage and specific areas of alignment and misalignment]
-                
-                ## Key Job Requirements Not Met
-                [List specific requirements from the job description that are not addressed in the resume, with recommendations on how to address each gap]
-                """
-            
+            base_prompt = self._build_analysis_prompt(resume_text, job_description, job_role)
+
             response = self.model.generate_content(base_prompt)
             analysis = response.text.strip()
             
@@ -299,6 +355,40 @@ class AIResumeAnalyzer:
             return {"error": f"Analysis failed: {str(e)}"}
 
     
+    def analyze_resume_with_openrouter(self, resume_text, job_description=None, job_role=None):
+        """Analyze resume using an OpenRouter-hosted model"""
+        if not resume_text:
+            return {"error": "Resume text is required for analysis."}
+
+        if not self.openrouter_api_key:
+            return {"error": "OpenRouter API key is not configured."}
+
+        try:
+            prompt = self._build_analysis_prompt(resume_text, job_description, job_role)
+            response = requests.post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers={"Authorization": f"Bearer {self.openrouter_api_key}"},
+                json={
+                    "model": "openai/gpt-3.5-turbo",
+                    "messages": [
+                        {"role": "system", "content": ANALYSIS_RUBRIC},
+                        {"role": "user", "content": prompt},
+                    ],
+                },
+                timeout=120,
+            )
+            response.raise_for_status()
+            analysis = response.json()["choices"][0]["message"]["content"].strip()
+
+            return {
+                "analysis": analysis,
+                "resume_score": self._extract_score_from_text(analysis),
+                "ats_score": self._extract_ats_score_from_text(analysis),
+            }
+
+        except Exception as e:
+            return {"error": f"Analysis failed: {str(e)}"}
+
     def generate_pdf_report(self, analysis_result, candidate_name, job_role):
         """Generate a PDF report of the analysis"""
         try:
@@ -578,6 +668,103 @@ class AIResumeAnalyzer:
             print(f"Error extracting ATS score: {str(e)}")
             return 0
             
+    def structure_analysis(self, analysis_text, model_used="Google Gemini"):
+        """Turn raw analysis text into the structured result dict"""
+        # Extract strengths
+        strengths = []
+        if "## Key Strengths" in analysis_text:
+            strengths_section = analysis_text.split("## Key Strengths")[1].split("##")[0].strip()
+            strengths = [clean_markdown(s.strip().replace("- ", "").replace("* ", "").replace("• ", ""))
+                        for s in strengths_section.split("\n")
+                        if s.strip() and (s.strip().startswith("-") or s.strip().startswith("*") or s.strip().startswith("•"))]
+
+        # Extract weaknesses/areas for improvement
+        weaknesses = []
+        if "## Areas for Improvement" in analysis_text:
+            weaknesses_section = analysis_text.split("## Areas for Improvement")[1].split("##")[0].strip()
+            weaknesses = [clean_markdown(w.strip().replace("- ", "").replace("* ", "").replace("• ", ""))
+                         for w in weaknesses_section.split("\n")
+                         if w.strip() and (w.strip().startswith("-") or w.strip().startswith("*") or w.strip().startswith("•"))]
+
+        # Extract suggestions/recommendations
+        suggestions = []
+        if "## Recommended Courses" in analysis_text:
+            suggestions_section = analysis_text.split("## Recommended Courses")[1].split("##")[0].strip()
+            suggestions = [clean_markdown(s.strip().replace("- ", "").replace("* ", "").replace("• ", ""))
+                             for s in suggestions_section.split("\n")
+                             if s.strip() and (s.strip().startswith("-") or s.strip().startswith("*") or s.strip().startswith("•"))]
+
+        return {
+            "score": self._extract_score_from_text(analysis_text),
+            "ats_score": self._extract_ats_score_from_text(analysis_text),
+            "strengths": strengths,
+            "weaknesses": weaknesses,
+            "suggestions": suggestions,
+            "full_response": analysis_text,
+            "model_used": model_used
+        }
+
+    def analyze_resume_stream(self, resume_text, job_role=None, role_info=None, model="Google Gemini"):
+        """Stream analysis text chunks from the selected model
+
+        Yields text fragments suitable for st.write_stream; callers can pass
+        the accumulated text to structure_analysis once the stream completes.
+        The backend that actually produced the text is recorded in
+        self.last_model_used, which can differ from the requested model
+        when a fallback answers. Failures are recorded in self.last_error
+        rather than inline in the stream, so callers can tell a partial
+        response apart from a complete one even when the error happens
+        mid-stream.
+        """
+        self.last_model_used = "Google Gemini"
+        self.last_error = None
+        if not resume_text:
+            self.last_error = "Resume text is required for analysis."
+            yield "Error: Resume text is required for analysis."
+            return
+
+        job_description = None
+        if role_info:
+            job_description = f"""
+            Role: {job_role}
+            Description: {role_info.get('description', '')}
+            Required Skills: {', '.join(role_info.get('required_skills', []))}
+            """
+
+        if model == "OpenRouter":
+            # OpenRouter has no streaming path here; hedge the blocking
+            # call with the Gemini fallback (both are IO-bound, so a
+            # failed primary costs max(t1, t2) instead of t1 + t2) and
+            # emit the winning response in one piece
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                primary = executor.submit(
+                    self.analyze_resume_with_openrouter, resume_text, job_description, job_role)
+                fallback = executor.submit(
+                    self.analyze_resume_with_gemini, resume_text, job_description, job_role)
+                result = primary.result()
+                model_used = "OpenRouter"
+                if result.get("error"):
+                    result = fallback.result()
+                    model_used = "Google Gemini"
+            if result.get("error"):
+                self.last_error = f"Analysis failed: {result['error']}"
+                yield f"Error: {self.last_error}"
+            else:
+                self.last_model_used = model_used
+                yield result.get("analysis", "")
+            return
+
+        try:
+            prompt = self._build_analysis_prompt(resume_text, job_description, job_role)
+            response = self.model.generate_content(prompt, stream=True)
+            for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            self.last_error = f"Analysis failed: {str(e)}"
+            yield f"\n\nError: {self.last_error}"
+
     def analyze_resume(self, resume_text, job_role=None, role_info=None, model="Google Gemini"):
         """Analyze a resume using the specified AI model"""
         try:
@@ -593,6 +780,21 @@ class AIResumeAnalyzer:
             if model == "Google Gemini":
                 result = self.analyze_resume_with_gemini(resume_text, job_description, job_role)
                 model_used = "Google Gemini"
+            elif model == "OpenRouter":
+                # Hedge the OpenRouter call with the Gemini fallback: both
+                # are IO-bound, so running them concurrently means a failed
+                # primary costs max(t1, t2) instead of t1 + t2
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    primary = executor.submit(
+                        self.analyze_resume_with_openrouter, resume_text, job_description, job_role)
+                    fallback = executor.submit(
+                        self.analyze_resume_with_gemini, resume_text, job_description, job_role)
+                    result = primary.result()
+                    model_used = "OpenRouter"
+                    if result.get("error"):
+                        result = fallback.result()
+                        model_used = "Google Gemini"
             elif model == "Anthropic Claude":
                 result = self.analyze_resume_with_anthropic(resume_text, job_description, job_role)
                 model_used = "Anthropic Claude"
@@ -603,50 +805,16 @@ class AIResumeAnalyzer:
             
             # Process the result to extract structured information
             analysis_text = result.get("analysis", "")
-            
-            # Extract strengths
-            strengths = []
-            if "## Key Strengths" in analysis_text:
-                strengths_section = analysis_text.split("## Key Strengths")[1].split("##")[0].strip()
-                strengths = [clean_markdown(s.strip().replace("- ", "").replace("* ", "").replace("• ", "")) 
-                            for s in strengths_section.split("\n") 
-                            if s.strip() and (s.strip().startswith("-") or s.strip().startswith("*") or s.strip().startswith("•"))]
-            
-            # Extract weaknesses/areas for improvement
-            weaknesses = []
-            if "## Areas for Improvement" in analysis_text:
-                weaknesses_section = analysis_text.split("## Areas for Improvement")[1].split("##")[0].strip()
-                weaknesses = [clean_markdown(w.strip().replace("- ", "").replace("* ", "").replace("• ", "")) 
-                             for w in weaknesses_section.split("\n") 
-                             if w.strip() and (w.strip().startswith("-") or w.strip().startswith("*") or w.strip().startswith("•"))]
-            
-            # Extract suggestions/recommendations
-            suggestions = []
-            if "## Recommended Courses" in analysis_text:
-                suggestions_section = analysis_text.split("## Recommended Courses")[1].split("##")[0].strip()
-                suggestions = [clean_markdown(s.strip().replace("- ", "").replace("* ", "").replace("• ", "")) 
-                                 for s in suggestions_section.split("\n") 
-                                 if s.strip() and (s.strip().startswith("-") or s.strip().startswith("*") or s.strip().startswith("•"))]
-            
-            # Extract score
+
+            structured = self.structure_analysis(analysis_text, model_used)
+
+            # Prefer the score already extracted by the model-specific path
             score = result.get("resume_score", 0)
-            if not score:
-                score = self._extract_score_from_text(analysis_text)
-            
-            # Extract ATS score
-            ats_score = self._extract_ats_score_from_text(analysis_text)
-            
-            # Return structured analysis
-            return {
-                "score": score,
-                "ats_score": ats_score,
-                "strengths": strengths,
-                "weaknesses": weaknesses,
-                "suggestions": suggestions,
-                "full_response": analysis_text,
-                "model_used": model_used
-            }
-            
+            if score:
+                structured["score"] = score
+
+            return structured
+
         except Exception as e:
             print(f"Error in analyze_resume: {str(e)}")
             import traceback
@@ -1406,12 +1574,13 @@ class AIResumeAnalyzer:
             if not session:
                 return None
 
-            # Get total number of analyses
-            total_analyses = session.query(AIAnalysis).count()
-            
-            # Get average resume score
-            average_score = session.query(func.avg(AIAnalysis.resume_score)).scalar() or 0
-            
+            # Get total number of analyses and average score in one round trip
+            total_analyses, average_score = session.query(
+                func.count(AIAnalysis.id),
+                func.avg(AIAnalysis.resume_score)
+            ).one()
+            average_score = average_score or 0
+
             # Get model usage distribution
             model_usage_query = session.query(
                 AIAnalysis.model_used, 
@@ -1,36 +1,52 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, func
+from sqlalchemy import create_engine, event, text, Column, Integer, String, Text, DateTime, func, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 import datetime
-import json
+import functools
 import os
+
+# Prefer orjson for serializing resume payloads (C implementation, much
+# faster on the nested dicts the builder produces); fall back to stdlib
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj):
+        return json.dumps(obj)
+
+    _json_loads = json.loads
 from dotenv import load_dotenv
 import streamlit as st
 
 def load_env_file():
-    """Try to load .env file with different encodings"""
-    encodings = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252']
-    for encoding in encodings:
-        try:
-            load_dotenv(encoding=encoding)
-            return True
-        except Exception as e:
-            continue
-    return False
+    """Load the .env file if one exists (single UTF-8 parse)"""
+    return load_dotenv() if os.path.exists(".env") else False
+
+# Which secrets.toml section each known key lives in
+_SECRET_SECTIONS = {
+    "GOOGLE_API_KEY": "api_keys",
+    "OPENROUTER_API_KEY": "api_keys",
+    "DATABASE_URL": "database",
+}
 
-# Get environment variables from either .env file or Streamlit secrets
+# Get environment variables from either .env file or Streamlit secrets.
+# Memoized: the secrets TOML traversal and try/except only run once per key.
+@functools.lru_cache(maxsize=None)
 def get_env_var(key, default=None):
     # First try to get from Streamlit secrets
-    try:
-        if key == "GOOGLE_API_KEY":
-            return st.secrets["api_keys"]["GOOGLE_API_KEY"]
-        elif key == "OPENROUTER_API_KEY":
-            return st.secrets["api_keys"]["OPENROUTER_API_KEY"]
-        elif key == "DATABASE_URL":
-            return st.secrets["database"]["DATABASE_URL"]
-    except Exception:
-        pass
-    
+    section = _SECRET_SECTIONS.get(key)
+    if section is not None:
+        try:
+            return st.secrets[section][key]
+        except Exception:
+            pass
+
     # If not found in secrets, try environment variables
     return os.getenv(key, default)
 
@@ -41,11 +57,38 @@ if not load_env_file():
 # Database configuration
 DATABASE_URL = get_env_var("DATABASE_URL", "sqlite:///resume_data.db")
 
-# Create SQLAlchemy engine
-engine = create_engine(DATABASE_URL)
+# Create SQLAlchemy engine. One engine per process: connections are pooled
+# and reused instead of being re-established per Streamlit rerun.
+# Pooling details differ per backend, so configure them separately.
+if DATABASE_URL.startswith("sqlite"):
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=5,
+        max_overflow=10,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets readers and the writer proceed concurrently, and
+        # synchronous=NORMAL drops the per-commit fsync that dominates
+        # save_resume_data latency (safe with WAL journaling)
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+else:
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create SessionLocal class (thread-local sessions over the shared pool)
+SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
 
 # Create Base class
 Base = declarative_base()
@@ -55,7 +98,7 @@ class Resume(Base):
     __tablename__ = 'resumes'
     
     id = Column(Integer, primary_key=True)
-    user_id = Column(String(100))
+    user_id = Column(String(100), index=True)
     job_role = Column(String(100))
     content = Column(Text)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
@@ -66,26 +109,30 @@ class Analysis(Base):
     __tablename__ = 'analyses'
     
     id = Column(Integer, primary_key=True)
-    resume_id = Column(Integer)
+    resume_id = Column(Integer, index=True)
     analysis_data = Column(Text)  # Store JSON data
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
 class AIAnalysis(Base):
     __tablename__ = 'ai_analyses'
-    
+    # Composite index lets the model/role GROUP BY queries be satisfied
+    # from the index instead of scanning the table
+    __table_args__ = (Index('ix_ai_analyses_model_role', 'model_used', 'job_role'),)
+
     id = Column(Integer, primary_key=True)
-    resume_id = Column(Integer)
-    model_used = Column(String(100))
+    resume_id = Column(Integer, index=True)
+    model_used = Column(String(100), index=True)
     resume_score = Column(Integer)
-    job_role = Column(String(100))
+    job_role = Column(String(100), index=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
 class DatabaseManager:
-    def __init__(self, db_path='resume_data.db'):
-        self.engine = create_engine(f'sqlite:///{db_path}')
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+    def __init__(self):
+        # Reuse the module-level engine and scoped session: schema creation
+        # already happened once at import, and the connection pool is shared
+        # instead of being rebuilt per instance
+        self.engine = engine
+        self.session = SessionLocal()
     
     def save_resume(self, user_id, job_role, content):
         resume = Resume(
@@ -122,81 +169,98 @@ class DatabaseManager:
         self.session.close()
 
 def get_database_connection():
-    """Get a database connection"""
+    """Get a database session from the shared pool"""
     try:
-        # Create a new session
-        Session = sessionmaker(bind=engine)
-        session = Session()
-        return session
+        return SessionLocal()
     except Exception as e:
         print(f"Error connecting to database: {e}")
         return None
 
+@st.cache_resource
 def init_db():
-    """Initialize the database"""
+    """Create the schema once per process (no-op when the tables exist)"""
     try:
-        Base.metadata.create_all(engine)
-        print("Database initialized successfully")
+        Base.metadata.create_all(engine, checkfirst=True)
+        return True
     except Exception as e:
         print(f"Error initializing database: {e}")
-
-# Initialize database when module is imported
-init_db()
+        return False
 
 def save_resume_data(resume_data):
     """Save resume data to the database"""
-    session = get_database_connection()
-    try:
-        # Convert resume_data to JSON string
-        resume_json = json.dumps(resume_data)
-        
-        # Create a new Resume object
-        resume = Resume(
-            user_id="anonymous",  # We don't have user authentication yet
-            job_role=resume_data.get('target_role', 'Unknown'),
-            content=resume_json
-        )
-        
-        session.add(resume)
-        session.commit()
-        return resume.id
-    except Exception as e:
-        session.rollback()
-        raise e
-    finally:
-        session.close()
+    # Convert resume_data to JSON string
+    resume_json = _json_dumps(resume_data)
+
+    # Fire-and-forget insert: Core insert().returning() skips the ORM
+    # unit-of-work flush and fetches the new id in the same statement
+    with engine.begin() as conn:
+        return conn.execute(
+            Resume.__table__.insert()
+            .values(
+                user_id="anonymous",  # We don't have user authentication yet
+                job_role=resume_data.get('target_role', 'Unknown'),
+                content=resume_json
+            )
+            .returning(Resume.__table__.c.id)
+        ).scalar_one()
 
 def save_ai_analysis_data(resume_id, analysis_data):
     """Save AI analysis data to the database"""
-    session = get_database_connection()
-    try:
-        # Create a new AIAnalysis object
-        ai_analysis = AIAnalysis(
-            resume_id=resume_id,
-            model_used=analysis_data.get('model_used', 'Unknown'),
-            resume_score=analysis_data.get('resume_score', 0),
-            job_role=analysis_data.get('job_role', 'Unknown')
-        )
-        
-        session.add(ai_analysis)
-        session.commit()
-        return ai_analysis.id
-    except Exception as e:
-        session.rollback()
-        raise e
-    finally:
-        session.close()
+    with engine.begin() as conn:
+        new_id = conn.execute(
+            AIAnalysis.__table__.insert()
+            .values(
+                resume_id=resume_id,
+                model_used=analysis_data.get('model_used', 'Unknown'),
+                resume_score=analysis_data.get('resume_score', 0),
+                job_role=analysis_data.get('job_role', 'Unknown')
+            )
+            .returning(AIAnalysis.__table__.c.id)
+        ).scalar_one()
+    # New analysis changes the aggregates; drop the cached statistics
+    get_ai_analysis_statistics.clear()
+    return new_id
 
+# Single-scan statistics query: one round trip answers the count, the
+# average and both GROUP BY distributions (SQLite JSON1 syntax)
+_STATS_SQL = text("""
+    WITH s AS (SELECT resume_score, model_used, job_role FROM ai_analyses)
+    SELECT
+        (SELECT COUNT(*) FROM s) AS total,
+        (SELECT AVG(resume_score) FROM s) AS avg_score,
+        (SELECT json_group_object(model_used, cnt)
+           FROM (SELECT model_used, COUNT(*) AS cnt FROM s GROUP BY model_used)) AS model_json,
+        (SELECT json_group_object(job_role, cnt)
+           FROM (SELECT job_role, COUNT(*) AS cnt FROM s GROUP BY job_role)) AS role_json
+""")
+
+@st.cache_data(ttl=60, show_spinner=False)
 def get_ai_analysis_statistics():
-    """Get statistics about AI analyses"""
+    """Get statistics about AI analyses (cached; invalidated on each save)"""
+    if DATABASE_URL.startswith("sqlite"):
+        try:
+            with engine.connect() as conn:
+                total, avg_score, model_json, role_json = conn.execute(_STATS_SQL).one()
+            return {
+                'total_analyses': total or 0,
+                'average_score': float(avg_score or 0),
+                'model_usage': _json_loads(model_json) if model_json else {},
+                'job_roles': _json_loads(role_json) if role_json else {}
+            }
+        except Exception:
+            # Older SQLite without the JSON1 extension; use the ORM path
+            pass
+
     session = get_database_connection()
     try:
-        # Get total number of analyses
-        total_analyses = session.query(AIAnalysis).count() or 0
-        
-        # Get average resume score
-        average_score = session.query(func.avg(AIAnalysis.resume_score)).scalar() or 0
-        
+        # Get total number of analyses and average score in one round trip
+        total_analyses, average_score = session.query(
+            func.count(AIAnalysis.id),
+            func.avg(AIAnalysis.resume_score)
+        ).one()
+        total_analyses = total_analyses or 0
+        average_score = average_score or 0
+
         # Get model usage distribution
         model_usage_query = session.query(
             AIAnalysis.model_used, 
@@ -3,6 +3,9 @@ Resume Analyzer Module
 """
 import re
 import io
+import hashlib
+from collections import defaultdict
+
 import PyPDF2
 from docx import Document
 import fitz  # PyMuPDF
@@ -10,6 +13,66 @@ import pandas as pd
 import numpy as np
 from typing import Union, Dict, List, Any
 
+# Optional: pyahocorasick gives one-pass multi-keyword scanning; the
+# per-category substring loops remain as the fallback
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Patterns are compiled once at import so the scoring helpers don't pay
+# regex-cache lookups (or recompilation) on every call
+_ATS_SECTION_RE = re.compile(r'\b(experience|education|skills)\b')
+_CAP_RE = re.compile(r'[A-Z][a-z]+')
+_EXPERIENCE_RE = re.compile(r'\b(experience|work|job)\b')
+_EDUCATION_RE = re.compile(r'\b(education|university|college|school)\b')
+_SKILLS_RE = re.compile(r'\b(skills|expertise|competencies)\b')
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_PHONE_RE = re.compile(r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+')
+_CONTACT_RES = (
+    re.compile(r'\b[\w\.-]+@[\w\.-]+\.\w+\b'),  # email
+    re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),  # phone
+    re.compile(r'linkedin\.com/\w+'),  # LinkedIn
+)
+
+_EDUCATION_KEYWORDS = [
+    'education', 'academic', 'qualification', 'degree', 'university', 'college',
+    'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
+    'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc', 'bca', 'mca', 'b.com',
+    'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
+]
+_EXPERIENCE_KEYWORDS = [
+    'experience', 'employment', 'work history', 'professional experience',
+    'work experience', 'career history', 'professional background',
+    'employment history', 'job history', 'positions held',
+    'job title', 'job responsibilities', 'job description', 'job summary'
+]
+_PROJECT_KEYWORDS = [
+    'projects', 'personal projects', 'academic projects', 'key projects',
+    'major projects', 'professional projects', 'project experience',
+    'relevant projects', 'featured projects', 'latest projects',
+    'top projects'
+]
+
+# Frozen lowercase sets make the exact header-line checks O(1) instead
+# of an equality scan over the keyword list
+_EDUCATION_KW_SET = frozenset(_EDUCATION_KEYWORDS)
+_EXPERIENCE_KW_SET = frozenset(_EXPERIENCE_KEYWORDS)
+_PROJECT_KW_SET = frozenset(_PROJECT_KEYWORDS)
+
+# Entries within a section body are separated by blank lines
+_BLANK_SPLIT_RE = re.compile(r'\n\s*\n')
+
+# Skills are delimited by commas or line breaks within their section;
+# scanning stops at the next major section
+_SKILL_SPLIT_RE = re.compile(r'[,\n]')
+_SKILLS_STOP_RE = re.compile(r'\b(experience|education|work)\b')
+
+def _header_re(keywords):
+    """Compile one case-insensitive alternation over a keyword list"""
+    return re.compile(r'\b(' + '|'.join(map(re.escape, keywords)) + r')\b', re.IGNORECASE)
+
 class ResumeAnalyzer:
     def __init__(self):
         """Initialize the ResumeAnalyzer"""
@@ -20,15 +83,134 @@ class ResumeAnalyzer:
             'projects': ['projects', 'portfolio', 'achievements'],
             'summary': ['summary', 'profile', 'objective', 'about']
         }
+        self.document_types = {
+            'resume': [
+                'education', 'experience', 'skills', 'projects', 'summary',
+                'objective', 'certifications', 'achievements', 'references'
+            ]
+        }
+        self.essential_sections = {
+            'contact': ['email', 'phone', 'address', 'linkedin'],
+            'education': ['education', 'university', 'college', 'degree'],
+            'experience': ['experience', 'employment', 'work history', 'internship'],
+            'skills': ['skills', 'technologies', 'tools', 'languages']
+        }
+
+        # One automaton over every keyword list: a single O(len(text)) pass
+        # reports all hits with their (group, category) labels instead of a
+        # substring scan per keyword per category
+        self._keyword_groups = {
+            'sections': self.sections,
+            'essential': self.essential_sections,
+            'doc_types': self.document_types,
+        }
+
+        # Flatten the nested dicts-of-lists once: a single tuple of
+        # (lowered keyword, (group, category)) pairs feeds both the
+        # automaton build and the fallback scan without re-walking dicts
+        # or re-lowering keywords per call
+        self._flat_keywords = tuple(
+            (keyword.lower(), (group, category))
+            for group, categories in self._keyword_groups.items()
+            for category, keywords in categories.items()
+            for keyword in keywords
+        )
+        # Byte copies for the fallback scan: the keywords are ASCII, and
+        # bytes.__contains__ dispatches to the C memmem fast path
+        self._flat_keywords_b = tuple(
+            (keyword.encode('ascii'), keyword, cat)
+            for keyword, cat in self._flat_keywords
+        )
+
+        if ahocorasick is not None:
+            kw_cats = {}
+            for keyword, cat in self._flat_keywords:
+                kw_cats.setdefault(keyword, []).append(cat)
+            self._ac = ahocorasick.Automaton()
+            for keyword, cats in kw_cats.items():
+                self._ac.add_word(keyword, (keyword, tuple(cats)))
+            self._ac.make_automaton()
+        else:
+            self._ac = None
+
+        # One compiled alternation per section replaces a Python `in` check
+        # per keyword per line in the extractors below
+        self._edu_header_re = _header_re(_EDUCATION_KEYWORDS)
+        self._exp_header_re = _header_re(_EXPERIENCE_KEYWORDS)
+        self._proj_header_re = _header_re(_PROJECT_KEYWORDS)
+
+        # All known header lines in one anchored pattern: a single finditer
+        # pass splits the document at section boundaries
+        all_headers = sorted(
+            set(_EDUCATION_KEYWORDS) | set(_EXPERIENCE_KEYWORDS)
+            | set(_PROJECT_KEYWORDS) | set(self.document_types['resume']),
+            key=len, reverse=True
+        )
+        self._all_headers_re = re.compile(
+            r'(?im)^[^\S\n]*(?:' + '|'.join(map(re.escape, all_headers)) + r')\b.*$'
+        )
+
+        # Shared "this line mentions another section" test, compiled once
+        # from the resume heading list
+        self._other_section_re = _header_re(self.document_types['resume'])
+
+        # Analyses are deterministic in (text, required skills); repeated
+        # reruns over the same upload reuse the previous result
+        self._analysis_cache = {}
+
+    def _keyword_hits(self, text_lower):
+        """Scan the text once and bucket keyword hits by (group, category)"""
+        hits = defaultdict(set)
+        if self._ac is not None:
+            for _, (keyword, cats) in self._ac.iter(text_lower):
+                for cat in cats:
+                    hits[cat].add(keyword)
+        else:
+            text_bytes = text_lower.encode('ascii', 'ignore')
+            for keyword_b, keyword, cat in self._flat_keywords_b:
+                if keyword_b in text_bytes:
+                    hits[cat].add(keyword)
+        return hits
+
+    def iter_pdf_pages(self, file):
+        """Yield the text of each PDF page without materializing the document
+
+        Callers that only need counts or keyword hits can consume pages
+        one at a time, keeping a single page resident instead of the
+        whole document.
+        """
+        if hasattr(file, 'read'):
+            doc = fitz.open(stream=file.read(), filetype="pdf")
+        else:
+            doc = fitz.open(file)
+        try:
+            for page in doc:
+                yield page.get_text()
+        finally:
+            doc.close()
 
     def extract_text_from_pdf(self, file) -> str:
         """Extract text from PDF file"""
+        # PyMuPDF extracts text in C and is an order of magnitude faster
+        # than PyPDF2; keep PyPDF2 only as a fallback for odd documents
+        try:
+            if hasattr(file, 'read'):
+                doc = fitz.open(stream=file.read(), filetype="pdf")
+            else:
+                doc = fitz.open(file)
+            try:
+                return "".join(page.get_text() for page in doc)
+            finally:
+                doc.close()
+        except Exception:
+            pass
+
         try:
+            if hasattr(file, 'seek'):
+                file.seek(0)
             pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-            return text
+            parts = [page.extract_text() or "" for page in pdf_reader.pages]
+            return "".join(parts)
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
 
@@ -36,10 +218,8 @@ class ResumeAnalyzer:
         """Extract text from DOCX file"""
         try:
             doc = Document(file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+            # Join once rather than growing a string per paragraph
+            return "\n".join(paragraph.text for paragraph in doc.paragraphs)
         except Exception as e:
             raise Exception(f"Error extracting text from DOCX: {str(e)}")
 
@@ -50,29 +230,52 @@ class ResumeAnalyzer:
             if not text:
                 return {'error': 'No text content found in resume'}
 
+            # Key the cache on a digest of the text plus the skill list so
+            # widget-driven reruns don't redo the same analysis
+            jr_key = tuple(sorted(job_requirements.get('required_skills', []))) if job_requirements else None
+            cache_key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), jr_key)
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Lowercase once; every helper below reads the same copy
+            text_lower = text.lower()
+
             # Basic analysis
             analysis = {
                 'document_type': 'resume',
-                'ats_score': self._calculate_ats_score(text),
+                'ats_score': self._calculate_ats_score(text, text_lower),
                 'format_score': self._calculate_format_score(text),
-                'section_score': self._calculate_section_score(text),
-                'keyword_match': self._analyze_keyword_match(text, job_requirements),
-                'suggestions': self._generate_suggestions(text)
+                'section_score': self._calculate_section_score(text_lower),
+                'keyword_match': self._analyze_keyword_match(text_lower, job_requirements),
+                'suggestions': self._generate_suggestions(text, text_lower)
             }
 
+            if len(self._analysis_cache) >= 64:
+                self._analysis_cache.clear()
+            self._analysis_cache[cache_key] = analysis
             return analysis
         except Exception as e:
             return {'error': f'Error analyzing resume: {str(e)}'}
 
-    def _calculate_ats_score(self, text: str) -> int:
+    def analyze_resumes(self, resumes: List[Dict[str, Any]], job_requirements: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Analyze a batch of resumes against the same job requirements
+
+        The keyword automaton, compiled patterns and analysis cache built
+        at construction are shared across the whole batch, so per-resume
+        cost is just the scans themselves.
+        """
+        return [self.analyze_resume(resume_data, job_requirements) for resume_data in resumes]
+
+    def _calculate_ats_score(self, text: str, text_lower: str) -> int:
         """Calculate ATS compatibility score"""
         score = 100
         # Check for common ATS issues
         if len(text) < 100:
             score -= 20
-        if not re.search(r'\b(experience|education|skills)\b', text.lower()):
+        if not _ATS_SECTION_RE.search(text_lower):
             score -= 15
-        if re.search(r'[^\x00-\x7F]', text):  # Non-ASCII characters
+        if not text.isascii():  # Non-ASCII characters
             score -= 10
         return max(0, score)
 
@@ -80,23 +283,20 @@ class ResumeAnalyzer:
         """Calculate format score"""
         score = 100
         # Check formatting elements
-        if not re.search(r'\n{2,}', text):  # No double line breaks
+        if '\n\n' not in text:  # No double line breaks
             score -= 10
-        if not re.search(r'[A-Z][a-z]+', text):  # No proper capitalization
+        if not _CAP_RE.search(text):  # No proper capitalization
             score -= 10
         return max(0, score)
 
-    def _calculate_section_score(self, text: str) -> int:
+    def _calculate_section_score(self, text_lower: str) -> int:
         """Calculate section completeness score"""
-        score = 100
-        found_sections = 0
-        for section_keywords in self.sections.values():
-            if any(keyword in text.lower() for keyword in section_keywords):
-                found_sections += 1
+        hits = self._keyword_hits(text_lower)
+        found_sections = sum(1 for section in self.sections if hits.get(('sections', section)))
         score = (found_sections / len(self.sections)) * 100
         return int(score)
 
-    def _analyze_keyword_match(self, text: str, job_requirements: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _analyze_keyword_match(self, text_lower: str, job_requirements: Dict[str, Any] = None) -> Dict[str, Any]:
         """Analyze keyword match with job requirements"""
         if not job_requirements:
             return {'score': 0, 'missing_skills': []}
@@ -106,7 +306,7 @@ class ResumeAnalyzer:
         missing_skills = []
 
         for skill in required_skills:
-            if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text.lower()):
+            if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
                 found_skills.append(skill)
             else:
                 missing_skills.append(skill)
@@ -118,7 +318,7 @@ class ResumeAnalyzer:
             'missing_skills': missing_skills
         }
 
-    def _generate_suggestions(self, text: str) -> List[str]:
+    def _generate_suggestions(self, text: str, text_lower: str = None) -> List[str]:
         """Generate improvement suggestions"""
         suggestions = []
         
@@ -126,26 +326,35 @@ class ResumeAnalyzer:
         if len(text) < 200:
             suggestions.append("Resume appears too short. Consider adding more details about your experience and skills.")
         
-        if not re.search(r'\b(experience|work|job)\b', text.lower()):
+        if text_lower is None:
+            text_lower = text.lower()
+        if not _EXPERIENCE_RE.search(text_lower):
             suggestions.append("No work experience section found. Add your professional experience.")
         
-        if not re.search(r'\b(education|university|college|school)\b', text.lower()):
+        if not _EDUCATION_RE.search(text_lower):
             suggestions.append("No education section found. Add your educational background.")
         
-        if not re.search(r'\b(skills|expertise|competencies)\b', text.lower()):
+        if not _SKILLS_RE.search(text_lower):
             suggestions.append("No skills section found. List your technical and soft skills.")
         
         return suggestions
 
     def detect_document_type(self, text):
         text = text.lower()
+        hits = self._keyword_hits(text)
+
+        # No keyword hit at all: skip the word-count split and scoring
+        if not any(hits.get(('doc_types', doc_type)) for doc_type in self.document_types):
+            return 'unknown'
+
+        word_count = len(text.split()) + 1  # Add 1 to avoid division by zero
         scores = {}
-        
+
         # Calculate score for each document type
         for doc_type, keywords in self.document_types.items():
-            matches = sum(1 for keyword in keywords if keyword in text)
+            matches = len(hits.get(('doc_types', doc_type), ()))
             density = matches / len(keywords)
-            frequency = matches / (len(text.split()) + 1)  # Add 1 to avoid division by zero
+            frequency = matches / word_count
             scores[doc_type] = (density * 0.7) + (frequency * 0.3)
         
         # Get the highest scoring document type
@@ -156,20 +365,23 @@ class ResumeAnalyzer:
         
     def calculate_keyword_match(self, resume_text, required_skills):
         resume_text = resume_text.lower()
-        found_skills = []
-        missing_skills = []
-        
-        for skill in required_skills:
-            skill_lower = skill.lower()
-            # Check for exact match
-            if skill_lower in resume_text:
-                found_skills.append(skill)
-            # Check for partial matches (e.g., "Python" in "Python programming")
-            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
-                found_skills.append(skill)
-            else:
-                missing_skills.append(skill)
-                
+        found = set()
+
+        if ahocorasick is not None and required_skills:
+            # One O(len(text)) automaton pass finds every skill at once
+            # instead of a substring scan per skill
+            aho = ahocorasick.Automaton()
+            for skill in required_skills:
+                aho.add_word(skill.lower(), skill)
+            aho.make_automaton()
+            for _, skill in aho.iter(resume_text):
+                found.add(skill)
+        else:
+            found.update(skill for skill in required_skills if skill.lower() in resume_text)
+
+        found_skills = [skill for skill in required_skills if skill in found]
+        missing_skills = [skill for skill in required_skills if skill not in found]
+
         match_score = (len(found_skills) / len(required_skills)) * 100 if required_skills else 0
         
         return {
@@ -179,11 +391,11 @@ class ResumeAnalyzer:
         }
         
     def check_resume_sections(self, text):
-        text = text.lower()
+        hits = self._keyword_hits(text.lower())
         section_scores = {}
         
         for section, keywords in self.essential_sections.items():
-            found = sum(1 for keyword in keywords if keyword in text)
+            found = len(hits.get(('essential', section), ()))
             section_scores[section] = min(25, (found / len(keywords)) * 25)
             
         return sum(section_scores.values())
@@ -198,29 +410,35 @@ class ResumeAnalyzer:
             score -= 30
             deductions.append("Resume is too short")
             
+        # One pass over the lines answers the header, bullet and spacing
+        # checks together instead of three separate traversals
+        has_upper = has_bullet = has_double_blank = False
+        prev_empty = False
+        for line in lines:
+            stripped = line.strip()
+            has_upper = has_upper or line.isupper()
+            has_bullet = has_bullet or stripped.startswith(('•', '-', '*'))
+            if prev_empty and not stripped:
+                has_double_blank = True
+            prev_empty = not stripped
+
         # Check for section headers
-        if not any(line.isupper() for line in lines):
+        if not has_upper:
             score -= 20
             deductions.append("No clear section headers found")
-            
+
         # Check for bullet points
-        if not any(line.strip().startswith(('•', '-', '*')) for line in lines):
+        if not has_bullet:
             score -= 20
             deductions.append("No bullet points found")
-            
+
         # Check for consistent spacing
-        if any(len(line.strip()) == 0 and len(next_line.strip()) == 0 
-               for line, next_line in zip(lines[:-1], lines[1:])):
+        if has_double_blank:
             score -= 15
             deductions.append("Inconsistent spacing between sections")
             
         # Check for contact information format
-        contact_patterns = [
-            r'\b[\w\.-]+@[\w\.-]+\.\w+\b',  # email
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # phone
-            r'linkedin\.com/\w+',  # LinkedIn
-        ]
-        if not any(re.search(pattern, text) for pattern in contact_patterns):
+        if not any(pattern.search(text) for pattern in _CONTACT_RES):
             score -= 15
             deductions.append("Missing or improperly formatted contact information")
             
@@ -229,10 +447,16 @@ class ResumeAnalyzer:
     def extract_text_from_file(self, file: Union[bytes, io.BytesIO], file_type: str) -> str:
         """Unified method to extract text from different file types"""
         try:
+            # Read the upload once; the parsers (including the PDF
+            # fallback, which rewinds before retrying) share one
+            # in-memory copy with a known stream position
+            data = file.read() if hasattr(file, 'read') else file
+            buf = io.BytesIO(data)
+
             if file_type.lower() == 'pdf':
-                return self.extract_text_from_pdf(file)
+                return self.extract_text_from_pdf(buf)
             elif file_type.lower() in ['docx', 'doc']:
-                return self.extract_text_from_docx(file)
+                return self.extract_text_from_docx(buf)
             else:
                 raise ValueError(f"Unsupported file type: {file_type}")
         except Exception as e:
@@ -240,13 +464,9 @@ class ResumeAnalyzer:
 
     def extract_personal_info(self, text):
         """Extract personal information from resume text"""
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        phone_pattern = r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}'
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        
-        email = re.search(email_pattern, text)
-        phone = re.search(phone_pattern, text)
-        linkedin = re.search(linkedin_pattern, text)
+        email = _EMAIL_RE.search(text)
+        phone = _PHONE_RE.search(text)
+        linkedin = _LINKEDIN_RE.search(text)
         
         return {
             'email': email.group(0) if email else '',
@@ -254,159 +474,76 @@ class ResumeAnalyzer:
             'linkedin': linkedin.group(0) if linkedin else ''
         }
 
-    def extract_education(self, text):
-        """Extract education information from resume text"""
-        education = []
-        lines = text.split('\n')
-        education_keywords = [
-            'education', 'academic', 'qualification', 'degree', 'university', 'college',
-            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
-            'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
-            'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
-        ]
-        in_education_section = False
-        current_entry = []
+    def _extract_section(self, text, header_re, header_keywords):
+        """Slice section bodies in one header scan for the education/experience/projects extractors
 
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in education_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in education_keywords):
-                    # This line contains education info, not just a header
-                    current_entry.append(line)
-                in_education_section = True
+        header_keywords must be a lowercase frozenset for the exact
+        header-line membership test.
+
+        One finditer pass over the combined header pattern locates every
+        section boundary; the matching section's body is then split into
+        entries at blank lines. This replaces the old per-line Python
+        state machine with two C-level regex passes.
+        """
+        entries = []
+        matches = list(self._all_headers_re.finditer(text))
+
+        for i, match in enumerate(matches):
+            header_line = match.group(0).strip()
+            if not header_re.search(header_line):
                 continue
-            
-            if in_education_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(edu_key.lower() in line.lower() for edu_key in education_keywords):
-                        in_education_section = False
-                        if current_entry:
-                            education.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    education.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            education.append(' '.join(current_entry))
-        
-        return education
+
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+            body = text[match.end():end]
+
+            current = []
+            if header_line.lower() not in header_keywords:
+                # The header line carries section info, not just a heading
+                current.append(header_line)
+
+            for block in _BLANK_SPLIT_RE.split(body):
+                joined = ' '.join(block.split())
+                if joined:
+                    current.append(joined)
+                    entries.append(' '.join(current))
+                    current = []
+
+            if current:
+                entries.append(' '.join(current))
+
+        return entries
+
+    def extract_education(self, text):
+        """Extract education information from resume text"""
+        return self._extract_section(text, self._edu_header_re, _EDUCATION_KW_SET)
 
     def extract_experience(self, text):
         """Extract work experience information from resume text"""
-        experience = []
-        lines = text.split('\n')
-        experience_keywords = [
-            'experience', 'employment', 'work history', 'professional experience',
-            'work experience', 'career history', 'professional background',
-            'employment history', 'job history', 'positions held', 'experience',
-            'job title', 'job responsibilities', 'job description', 'job summary'
-        ]
-        in_experience_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in experience_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in experience_keywords):
-                    # This line contains experience info, not just a header
-                    current_entry.append(line)
-                in_experience_section = True
-                continue
-            
-            if in_experience_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(exp_key.lower() in line.lower() for exp_key in experience_keywords):
-                        in_experience_section = False
-                        if current_entry:
-                            experience.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    experience.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            experience.append(' '.join(current_entry))
-        
-        return experience
+        return self._extract_section(text, self._exp_header_re, _EXPERIENCE_KW_SET)
 
     def extract_projects(self, text):
         """Extract project information from resume text"""
-        projects = []
-        lines = text.split('\n')
-        project_keywords = [
-            'projects', 'personal projects', 'academic projects', 'key projects',
-            'major projects', 'professional projects', 'project experience',
-            'relevant projects', 'featured projects','latest projects',
-            'top projects'
-        ]
-        in_project_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in project_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in project_keywords):
-                    # This line contains project info, not just a header
-                    current_entry.append(line)
-                in_project_section = True
-                continue
-            
-            if in_project_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(proj_key.lower() in line.lower() for proj_key in project_keywords):
-                        in_project_section = False
-                        if current_entry:
-                            projects.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    projects.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            projects.append(' '.join(current_entry))
-        
-        return projects
+        return self._extract_section(text, self._proj_header_re, _PROJECT_KW_SET)
 
     def extract_skills(self, text):
         """Extract skills from resume text"""
-        skills = set()
-        lines = text.split('\n')
-        in_skills_section = False
-        
-        for line in lines:
-            line = line.strip().lower()
-            if 'skills' in line:
-                in_skills_section = True
-                continue
-                
-            if in_skills_section:
-                if any(section in line for section in ['experience', 'education', 'work']):
-                    break
-                    
-                # Extract skills from the line
-                potential_skills = [s.strip() for s in line.split(',')]
-                skills.update(s for s in potential_skills if len(s) > 2)
-        
-        return list(skills)
+        # Slice the skills section once and split it in a single pass
+        # instead of looping per line with strip/lower/split
+        text_lower = text.lower()
+        start = text_lower.find('skills')
+        if start == -1:
+            return []
+        start = text_lower.find('\n', start)
+        if start == -1:
+            return []
+
+        body = text_lower[start + 1:]
+        stop = _SKILLS_STOP_RE.search(body)
+        if stop:
+            body = body[:stop.start()]
+
+        skills = {s.strip() for s in _SKILL_SPLIT_RE.split(body)}
+        return [s for s in skills if len(s) > 2]
 
     def extract_summary(self, text):
         """Extract summary/objective from resume text"""
@@ -415,7 +552,8 @@ class ResumeAnalyzer:
         
         # Look for summary in first few lines
         for line in lines[:5]:
-            if line.strip() and not any(keyword in line.lower() for keyword in ['experience', 'education', 'skills']):
-                summary.append(line.strip())
+            stripped = line.strip()
+            if stripped and not self._other_section_re.search(line):
+                summary.append(stripped)
                 
         return ' '.join(summary)
\ No newline at end of file
@@ -5,26 +5,52 @@ from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from typing import Dict, Any
+import copy
 import io
 
+# Templates are data, not code: every style feeds the same builder and
+# only the parameters below differ. The presets currently all match
+# Modern, which the old per-template methods delegated to anyway.
+STYLE_PRESETS = {
+    'Modern': {'margin_in': 0.5, 'name_size_pt': 16},
+    'Professional': {'margin_in': 0.5, 'name_size_pt': 16},
+    'Minimal': {'margin_in': 0.5, 'name_size_pt': 16},
+    'Creative': {'margin_in': 0.5, 'name_size_pt': 16},
+}
+
 class ResumeBuilder:
     def __init__(self):
         """Initialize the Resume Builder"""
-        self.templates = {
-            'Modern': self._create_modern_template,
-            'Professional': self._create_professional_template,
-            'Minimal': self._create_minimal_template,
-            'Creative': self._create_creative_template
+        # The page setup is identical for every resume; build the styled
+        # empty document once per preset and deep-copy it per request
+        # instead of re-emitting the same XML each time
+        self._skeletons = {
+            name: self._build_skeleton(style) for name, style in STYLE_PRESETS.items()
         }
 
+    def _build_skeleton(self, style: Dict[str, Any]) -> Document:
+        """Build the empty styled document a template starts from"""
+        doc = Document()
+
+        # Set margins
+        margin = Inches(style['margin_in'])
+        for section in doc.sections:
+            section.top_margin = margin
+            section.bottom_margin = margin
+            section.left_margin = margin
+            section.right_margin = margin
+
+        return doc
+
     def generate_resume(self, resume_data: Dict[str, Any]) -> bytes:
         """Generate resume document based on template and data"""
         try:
             template_name = resume_data.get('template', 'Modern')
-            template_func = self.templates.get(template_name, self._create_modern_template)
+            if template_name not in STYLE_PRESETS:
+                template_name = 'Modern'
             
             # Create document
-            doc = template_func(resume_data)
+            doc = self._build(resume_data, template_name)
             
             # Save to buffer
             buffer = io.BytesIO()
@@ -36,24 +62,17 @@ class ResumeBuilder:
             print(f"Error generating resume: {str(e)}")
             return None
 
-    def _create_modern_template(self, data: Dict[str, Any]) -> Document:
-        """Create modern style resume"""
-        doc = Document()
-        
-        # Set margins
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = Inches(0.5)
-            section.bottom_margin = Inches(0.5)
-            section.left_margin = Inches(0.5)
-            section.right_margin = Inches(0.5)
+    def _build(self, data: Dict[str, Any], template_name: str) -> Document:
+        """Build a resume document from data and a style preset"""
+        style = STYLE_PRESETS[template_name]
+        doc = copy.deepcopy(self._skeletons[template_name])
 
         # Add header
         header = doc.add_paragraph()
         header.alignment = WD_ALIGN_PARAGRAPH.CENTER
         name = header.add_run(data['personal_info']['full_name'].upper())
         name.bold = True
-        name.font.size = Pt(16)
+        name.font.size = Pt(style['name_size_pt'])
 
         # Add contact info
         contact = doc.add_paragraph()
@@ -108,19 +127,4 @@ class ResumeBuilder:
                     p.add_run(f"{category.title()}: ").bold = True
                     p.add_run(', '.join(skill_list))
 
-        return doc
-
-    def _create_professional_template(self, data: Dict[str, Any]) -> Document:
-        """Create professional style resume"""
-        # Similar to modern template but with different styling
-        return self._create_modern_template(data)
-
-    def _create_minimal_template(self, data: Dict[str, Any]) -> Document:
-        """Create minimal style resume"""
-        # Similar to modern template but with minimal styling
-        return self._create_modern_template(data)
-
-    def _create_creative_template(self, data: Dict[str, Any]) -> Document:
-        """Create creative style resume"""
-        # Similar to modern template but with creative styling
-        return self._create_modern_template(data)
\ No newline at end of file
+        return doc
\ No newline at end of file